@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# flask-restify hot path benchmark
+#
+#   python benchmarks/bench.py                        # 전체 실행
+#   python benchmarks/bench.py -k validation          # 이름에 'validation'이 포함된 항목만
+#   python benchmarks/bench.py --json result.json     # 결과 저장
+#   python benchmarks/bench.py --compare result.json  # 저장된 baseline과 비교 (regression 발생시 exit code 1)
+
+import argparse
+import enum
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask_restify import fields  # noqa: E402
+from flask_restify.api import BaseAPI  # noqa: E402
+from flask_restify.docs.swagger import SwaggerDoc  # noqa: E402
+from flask_restify.resource.context import BaseContext  # noqa: E402
+from flask_restify.resource.namespace import Namespace  # noqa: E402
+from flask_restify.resource.restify import route, parameter, response, error, authenticate, compile_handler  # noqa: E402
+from flask_restify.util.parser import parse_params  # noqa: E402
+
+
+class Config:
+    SQLALCHEMY_DATABASE_URI = "sqlite://"
+    TESTING = True
+
+
+class Context(BaseContext):
+    session = None
+
+    def update_authkey(self, authkey):
+        self.session = authkey or None
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+BENCHMARKS = []
+
+
+def benchmark(name, number=None):
+    # setup 함수를 등록, setup은 측정할 callable을 반환
+    def decorator(setup):
+        BENCHMARKS.append({"name": name, "setup": setup, "number": number})
+        return setup
+
+    return decorator
+
+
+def measure(fn, number=None, repeat=5, min_time=0.2):
+    if number is None:
+        # 한 번의 repeat가 min_time 이상 걸리도록 반복 횟수 보정
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            elapsed = time.perf_counter() - start
+
+            if elapsed >= min_time or number >= 1 << 20:
+                break
+
+            number *= 10 if elapsed < min_time / 10 else 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0
+    }
+
+
+def _api(name):
+    api = BaseAPI(name, "benchmark")
+
+    # namespace / swagger 문서는 class 변수이므로 benchmark마다 분리
+    api.namespaces = {}
+    api.docs.namespace = {}
+    api.docs.path = {}
+
+    return api
+
+
+def _item_model():
+    return fields.Object(data={
+        "id": fields.Integer(range={"min": 0}),
+        "name": fields.String(length={"min": 1, "max": 64}, pattern=r"^\w+$"),
+        "price": fields.Float(range={"min": 0}),
+        "active": fields.Boolean(),
+        "color": fields.Enum(type=Color)
+    })
+
+
+def _item(i):
+    return {"id": i, "name": "item{0}".format(i), "price": i * 1.5, "active": "true", "color": "red"}
+
+
+# 1. scalar field validation
+
+_scalars = {
+    "integer": (fields.Integer(range={"min": 0, "max": 1000}), "42"),
+    "float": (fields.Float(range={"min": 0}), "3.14"),
+    "boolean": (fields.Boolean(), "true"),
+    "string": (fields.String(length={"min": 1, "max": 32}, pattern=r"^[a-z]+$"), "restify"),
+    "enum": (fields.Enum(type=Color), "green")
+}
+
+for _name, (_field, _value) in _scalars.items():
+    def _setup(field=_field, value=_value):
+        return lambda: field.validation(value)
+
+    def _setup_compiled(field=_field, value=_value):
+        validate = field.compile()
+        return lambda: validate(value)
+
+    benchmark("validation.{0}".format(_name))(_setup)
+    benchmark("validation.{0}.compiled".format(_name))(_setup_compiled)
+
+
+# 2. nested Object / Array validation
+
+for _size in [10, 100, 1000]:
+    def _setup(size=_size):
+        model = fields.Object(data={"items": fields.Array(item=_item_model())})
+        payload = json.dumps({"items": [_item(i) for i in range(size)]})
+
+        # validation이 입력을 변경하므로 매번 문자열에서 새로 파싱
+        return lambda: model.validation(payload)
+
+    def _setup_compiled(size=_size):
+        validate = fields.Object(data={"items": fields.Array(item=_item_model())}).compile()
+        payload = json.dumps({"items": [_item(i) for i in range(size)]})
+
+        return lambda: validate(payload)
+
+    benchmark("validation.nested.{0}".format(_size))(_setup)
+    benchmark("validation.nested.{0}.compiled".format(_size))(_setup_compiled)
+
+
+# 2-1. 대용량 숫자 배열 (일괄 변환 경로)
+
+for _size in [1000, 100000]:
+    def _setup(size=_size):
+        validate = fields.Array(item=fields.Integer(range={"min": 0, "max": 1000})).compile()
+        payload = json.dumps([i % 1000 for i in range(size)])
+
+        return lambda: validate(payload)
+
+    def _setup_float(size=_size):
+        validate = fields.Array(item=fields.Float(range={"min": 0}), packed="array").compile()
+        payload = json.dumps([i * 0.5 for i in range(size)])
+
+        return lambda: validate(payload)
+
+    benchmark("validation.numeric_array.{0}".format(_size))(_setup)
+    benchmark("validation.numeric_array.{0}.packed".format(_size))(_setup_float)
+
+
+# 2-2. field 생성 (모듈 import 시점 비용)
+
+@benchmark("fields.construct")
+def _setup():
+    return _item_model
+
+
+# 3. parse_params
+
+@benchmark("parse_params")
+def _setup():
+    blueprint = {
+        "item_id": fields.Integer(),
+        "q": fields.String(optional=True),
+        "limit": fields.Integer(optional=True, default=20, range={"min": 1, "max": 100}),
+        "color": fields.Enum(type=Color, optional=True)
+    }
+    params = {"item_id": "10", "q": "search", "limit": "50"}
+
+    return lambda: parse_params(blueprint, params, {})
+
+
+# 4. parameter() / route() wrapper chain (request context 안에서 직접 호출)
+
+def _wrapper_chain(compiled):
+    api = _api("wrapper_chain")
+    ns = Namespace(api, "bench", "/bench", "", Context)
+
+    @route(ns, "get", "/<item_id>")
+    @parameter(path={"item_id": fields.Integer()},
+               query={"q": fields.String(optional=True), "limit": fields.Integer(optional=True, default=20)})
+    @response(200, "ok", {"id": fields.Integer()})
+    @error(409, "conflict", KeyError)
+    @authenticate(optional=True)
+    def handler(ctx, item_id, q=None, limit=None):
+        return {"id": item_id, "q": q, "limit": limit}
+
+    api.add_namespace(ns)
+    app = api.init_server(Config)
+
+    ctx = app.test_request_context("/bench/10?q=x&limit=5")
+    ctx.push()
+
+    if compiled:
+        handler = compile_handler(handler)
+
+    context = Context()
+    return lambda: handler(context, item_id="10")
+
+
+benchmark("wrapper_chain")(lambda: _wrapper_chain(False))
+benchmark("wrapper_chain.compiled")(lambda: _wrapper_chain(True))
+
+
+# 5. handle_request end to end (Flask test client)
+
+@benchmark("handle_request.get")
+def _setup():
+    api = _api("handle_request_get")
+    ns = Namespace(api, "bench", "/bench", "", Context)
+
+    @route(ns, "get", "/<item_id>")
+    @parameter(path={"item_id": fields.Integer()}, query={"q": fields.String(optional=True)})
+    def handler(ctx, item_id, q=None):
+        return {"id": item_id, "q": q}
+
+    api.add_namespace(ns)
+    client = api.init_server(Config).test_client()
+
+    return lambda: client.get("/bench/10?q=x")
+
+
+@benchmark("handle_request.post")
+def _setup():
+    api = _api("handle_request_post")
+    ns = Namespace(api, "bench", "/bench", "", Context)
+
+    @route(ns, "post", "")
+    @parameter(body={"items": fields.Array(item=_item_model())})
+    @authenticate()
+    def handler(ctx, items):
+        return {"count": len(items)}, 201
+
+    api.add_namespace(ns)
+    client = api.init_server(Config).test_client()
+    body = {"items": [_item(i) for i in range(50)]}
+
+    return lambda: client.post("/bench", json=body, headers={"Authorization": "Bearer token"})
+
+
+@benchmark("handle_request.list")
+def _setup():
+    api = _api("handle_request_list")
+    ns = Namespace(api, "bench", "/bench", "", Context)
+    rows = [{"id": i, "name": "item{0}".format(i), "price": i * 1.5} for i in range(1000)]
+
+    @route(ns, "get", "")
+    def handler(ctx):
+        return rows
+
+    api.add_namespace(ns)
+    client = api.init_server(Config).test_client()
+
+    return lambda: client.get("/bench")
+
+
+# 6. SwaggerDoc 생성
+
+def _namespace(api, size, tag="bench"):
+    ns = Namespace(api, tag, "/" + tag, "", Context)
+
+    for i in range(size):
+        def handler(ctx, item_id, q=None):
+            return {}
+
+        handler.__qualname__ = "op{0}".format(i)
+
+        route(ns, "get", "/r{0}/<item_id>".format(i))(
+            parameter(path={"item_id": fields.Integer()}, query={"q": fields.String(optional=True)})(
+                response(200, "ok", {"item": _item_model()})(handler)))
+
+    return ns
+
+
+for _size in [10, 100, 1000]:
+    def _setup_add(size=_size):
+        ns = _namespace(_api("swagger"), size)
+
+        def run():
+            doc = SwaggerDoc("bench", "", "1.0.0")
+            doc.namespace = {}
+            doc.path = {}
+            doc.add_namespace(ns.path, ns)
+
+        return run
+
+    def _setup_json(size=_size):
+        ns = _namespace(_api("swagger"), size)
+
+        doc = SwaggerDoc("bench", "", "1.0.0")
+        doc.namespace = {}
+        doc.path = {}
+        doc.add_namespace(ns.path, ns)
+
+        return lambda: json.dumps(doc.to_json())
+
+    def _setup_build(size=_size):
+        ns = _namespace(_api("swagger"), size)
+
+        def run():
+            doc = SwaggerDoc("bench", "", "1.0.0")
+            doc.namespace = {}
+            doc.path = {}
+            doc.add_namespace(ns.path, ns)
+            doc.build()
+
+        return run
+
+    benchmark("swagger.add_namespace.{0}".format(_size))(_setup_add)
+    benchmark("swagger.build.{0}".format(_size))(_setup_build)
+    benchmark("swagger.to_json.{0}".format(_size))(_setup_json)
+
+
+# 7. init_server (route 100개)
+
+def _init_server(size):
+    api = _api("init_server")
+    api.add_namespace(_namespace(api, size))
+    api.init_server(Config)
+
+
+# 이미 import/초기화된 현재 프로세스에서 측정
+@benchmark("init_server.warm.100", number=1)
+def _setup():
+    return lambda: _init_server(100)
+
+
+# 새 interpreter에서 측정 (interpreter 시작 + import + route 등록 + init_server)
+@benchmark("init_server.cold.100", number=1)
+def _setup():
+    code = "import sys; sys.path.insert(0, {0!r}); import bench; bench._init_server(100)".format(os.path.dirname(os.path.abspath(__file__)))
+
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def run(pattern=None, quick=False):
+    results = {}
+
+    for bench in BENCHMARKS:
+        if pattern and pattern not in bench["name"]:
+            continue
+
+        fn = bench["setup"]()
+        result = measure(fn, number=bench["number"], repeat=3 if quick else 5, min_time=0.05 if quick else 0.2)
+        results[bench["name"]] = result
+
+        print("{0:<40} {1:>12.2f} us  (median, n={2}x{3})".format(bench["name"], result["median"] * 1e6, result["number"], result["repeat"]))
+
+    return results
+
+
+def _meta():
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "commit": commit,
+        "time": time.time()
+    }
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+
+    print()
+    print("{0:<40} {1:>12} {2:>12} {3:>8}".format("benchmark", "baseline", "current", "ratio"))
+
+    for name, result in results.items():
+        if name not in baseline["results"]:
+            continue
+
+        before = baseline["results"][name]["median"]
+        ratio = result["median"] / before if before > 0 else 1.0
+        mark = ""
+
+        if ratio > 1 + threshold:
+            mark = " slower"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            mark = " faster"
+
+        print("{0:<40} {1:>9.2f} us {2:>9.2f} us {3:>7.2f}x{4}".format(name, before * 1e6, result["median"] * 1e6, ratio, mark))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="flask-restify benchmarks")
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--json", dest="output", help="write results to this file")
+    parser.add_argument("--compare", dest="baseline", help="compare against a saved result file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as regression (default 0.1)")
+    parser.add_argument("--quick", action="store_true", help="fewer and shorter repeats")
+    args = parser.parse_args()
+
+    results = run(args.pattern, args.quick)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": _meta(), "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
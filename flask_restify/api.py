@@ -1,16 +1,45 @@
 # -*- coding: utf-8 -*-
 
-from flask_restify.docs import swagger, ui
-from flask_restify.util import error
-
-from flask import Flask, Response, request
-from flask_sqlalchemy import SQLAlchemy
-
-import json
+from flask_restify.docs import swagger
+from flask_restify.util import error, codec
+from flask_restify.util.compress import Compressor
+from flask_restify.util.timing import ServerTiming
+from flask_restify.util.metrics import Metrics, BUCKETS as metrics_buckets
+from flask_restify.util import admission
+from flask_restify.resource.restify import compile_handler
+
+from flask import Flask, Response, request, stream_with_context
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+import hashlib
+import inspect
+import random
+import time
 import traceback
 import sys
 import atexit
 
+# 사용하지 않는 기능(DB, profiler, tracemalloc, batch, swagger UI)은 init_server에서 필요할 때 import
+if TYPE_CHECKING:
+    from flask_sqlalchemy import SQLAlchemy
+    from flask_restify.util.profiler import Profiler
+    from flask_restify.util.memory import MemoryTracker
+    from flask_restify.batch import Batch
+
+
+class LazyDatabase:
+    # 처음 접근할 때 SQLAlchemy()를 생성 (flask_sqlalchemy import 비용을 DB를 쓰는 서비스만 부담)
+    def __init__(self):
+        self.db = None
+
+    def __get__(self, obj, owner):
+        if self.db is None:
+            from flask_sqlalchemy import SQLAlchemy
+            self.db = SQLAlchemy()
+
+        return self.db
+
 
 class RequestContext:
     pass
@@ -18,7 +47,22 @@ class RequestContext:
 
 class BaseAPI:
     app: Flask = None
-    db: SQLAlchemy = SQLAlchemy()
+    etag = False
+    compressor: Compressor = None
+    metrics: Metrics = None
+    profiler: "Profiler" = None
+    memory: "MemoryTracker" = None
+    batch: "Batch" = None
+    limiter: admission.Limiter = None
+    limiters = None
+    receive_hook = None
+    swaggerui = None
+    startup = None
+
+    timing_sample = 0.0
+    timing_toggle = False
+    timing_log = False
+    db: "SQLAlchemy" = LazyDatabase()
     namespaces = {}
     docs: swagger.SwaggerDoc = None
 
@@ -28,83 +72,604 @@ class BaseAPI:
         self.app = Flask(name)
         self.docs = swagger.SwaggerDoc(name, description, version)
 
-        self.swaggerui = ui.get_swaggerui_blueprint(
-            "/api/docs",
-            "/api/swagger.json",
-            config={
-                'app_name': name,
-                "displayRequestDuration": True,
-                "jsonEditor": True
-            }
-        )
-
     def init_server(self, config="app.config.DevelopmentConfig"):
+        # 단계별 소요시간은 self.startup에 기록 (RESTIFY_STARTUP_LOG 설정시 로그 출력)
+        timing = ServerTiming()
+
         self.app.config.from_object(config)
 
-        self.db.init_app(self.app)
-        atexit.register(self.on_exit)
+        codec.set_backend(self.app.config.get("RESTIFY_JSON_BACKEND", "auto"))
+        self.etag = self.app.config.get("RESTIFY_ETAG", False)
 
-        self.on_init()
+        self.timing_sample = self.app.config.get("RESTIFY_SERVER_TIMING_SAMPLE", 0.0)
+        self.timing_toggle = self.app.config.get("RESTIFY_SERVER_TIMING_TOGGLE", self.app.debug or self.app.testing)
+        self.timing_log = self.app.config.get("RESTIFY_SERVER_TIMING_LOG", False)
+
+        if self.app.config.get("RESTIFY_COMPRESS", False):
+            self.compressor = Compressor(
+                level=self.app.config.get("RESTIFY_COMPRESS_LEVEL", 6),
+                min_size=self.app.config.get("RESTIFY_COMPRESS_MIN_SIZE", 500),
+                mimetypes=self.app.config.get("RESTIFY_COMPRESS_MIMETYPES")
+            )
 
-        self.app.register_blueprint(self.swaggerui, url_prefix="/api/docs")
+        timing.mark("config")
 
-        self.app.add_url_rule("/api/swagger.json", "swagger",
-                              lambda *args, **kwargs: Response(response=json.dumps(self.docs.to_json()), status=200,
-                                                               mimetype="application/json"))
+        # db를 사용하거나 DB 설정이 있는 경우에만 SQLAlchemy 초기화
+        db = inspect.getattr_static(self, "db")
+        if not isinstance(db, LazyDatabase) or db.db is not None or \
+                self.app.config.get("SQLALCHEMY_DATABASE_URI") or self.app.config.get("SQLALCHEMY_BINDS"):
+            self.db.init_app(self.app)
+
+        timing.mark("database")
+
+        atexit.register(self.on_exit)
+
+        self.on_init()
+        timing.mark("on_init")
+
+        docs = self.app.config.get("RESTIFY_DOCS", True)
+
+        if docs:
+            from flask_restify.docs import ui
+
+            self.swaggerui = ui.get_swaggerui_blueprint(
+                "/api/docs",
+                "/api/swagger.json",
+                config={
+                    'app_name': self.app.name,
+                    "displayRequestDuration": True,
+                    "jsonEditor": True
+                }
+            )
+
+            self.app.register_blueprint(self.swaggerui, url_prefix="/api/docs")
+
+            self.app.add_url_rule("/api/swagger.json", "swagger", self.swagger_json)
+
+        timing.mark("docs")
+
+        if self.app.config.get("RESTIFY_METRICS", False):
+            self.metrics = Metrics(
+                buckets=self.app.config.get("RESTIFY_METRICS_BUCKETS", metrics_buckets),
+                directory=self.app.config.get("RESTIFY_METRICS_DIR")
+            )
+            self.app.add_url_rule(self.app.config.get("RESTIFY_METRICS_PATH", "/api/metrics"), "metrics", self.metrics_view)
+
+        if self.app.config.get("RESTIFY_TRACEMALLOC", False):
+            from flask_restify.util.memory import MemoryTracker
+
+            self.memory = MemoryTracker(
+                budget=self.app.config.get("RESTIFY_MEMORY_BUDGET"),
+                top=self.app.config.get("RESTIFY_TRACEMALLOC_TOP", 10),
+                frames=self.app.config.get("RESTIFY_TRACEMALLOC_FRAMES", 1),
+                logger=self.app.logger
+            )
+            self.app.add_url_rule(self.app.config.get("RESTIFY_TRACEMALLOC_PATH", "/api/memory"), "memory", self.memory_view)
+
+        if self.app.config.get("RESTIFY_PROFILE_TOKEN"):
+            from flask_restify.util.profiler import Profiler
+
+            self.profiler = Profiler(
+                self.app.config["RESTIFY_PROFILE_TOKEN"],
+                sample_rate=self.app.config.get("RESTIFY_PROFILE_SAMPLE_RATE", 0.0),
+                rate=self.app.config.get("RESTIFY_PROFILE_RATE", 1.0),
+                buffer=self.app.config.get("RESTIFY_PROFILE_BUFFER", 10),
+                top=self.app.config.get("RESTIFY_PROFILE_TOP", 30)
+            )
+
+            profile_path = self.app.config.get("RESTIFY_PROFILE_PATH", "/api/profiles")
+            self.app.add_url_rule(profile_path, "profiles", self.profiles_view)
+            self.app.add_url_rule(profile_path + "/<report_id>", "profile", self.profiles_view)
+
+        if self.app.config.get("RESTIFY_BATCH", False):
+            from flask_restify.batch import Batch
+
+            self.batch = Batch(
+                self,
+                limit=self.app.config.get("RESTIFY_BATCH_LIMIT", 50),
+                workers=self.app.config.get("RESTIFY_BATCH_WORKERS", 4)
+            )
+
+            batch_path = self.app.config.get("RESTIFY_BATCH_PATH", "/api/batch")
+            self.app.add_url_rule(batch_path, "batch", self.batch.view, methods=["POST"])
+            if docs:
+                self.docs.add_path(batch_path, "post", self.batch.swagger())
+
+        timing.mark("extensions")
+
+        # 재정의되지 않은 hook은 요청마다 호출하지 않음
+        if getattr(self.on_receive, "__func__", None) is not BaseAPI.on_receive:
+            self.receive_hook = self.on_receive
+
+        # 서버 전체 동시 처리 제한 (초과시 503), namespace/route 단위 제한은 429
+        queue_timeout = self.app.config.get("RESTIFY_QUEUE_TIMEOUT", 1.0)
+        self.limiters = {}
+        self.limiter = None
+        if self.app.config.get("RESTIFY_MAX_CONCURRENCY"):
+            self.limiter = admission.Limiter(
+                "server",
+                self.app.config["RESTIFY_MAX_CONCURRENCY"],
+                queue=self.app.config.get("RESTIFY_MAX_QUEUE", 0),
+                timeout=queue_timeout,
+                status=503,
+                adaptive=self.app.config.get("RESTIFY_ADAPTIVE_CONCURRENCY", False),
+                target_latency=self.app.config.get("RESTIFY_TARGET_LATENCY")
+            )
+            self.limiters["server"] = self.limiter
 
         for k, ns in self.namespaces.items():
+            ns_limiter = None
+            if ns.max_concurrency:
+                ns_limiter = admission.Limiter(ns.tag, ns.max_concurrency, queue=ns.max_queue,
+                                               timeout=ns.queue_timeout or queue_timeout, status=429, adaptive=ns.adaptive)
+                self.limiters[ns.tag] = ns_limiter
+
             root_path = ns.path
             for p, res in ns.routes.items():
                 path = root_path + p
                 for method, func in res.items():
-                    self.endpoint_map[func["title"]] = {"ns": ns, "func": func}
+                    options = func.get("admission", {})
+                    priority = options.get("priority", "normal")
+
+                    # 좁은 범위부터 획득 (route 대기 중에 namespace/서버 slot을 점유하지 않도록)
+                    limiters = []
+                    if options.get("max_concurrency"):
+                        limiter = admission.Limiter(func["title"], options["max_concurrency"], queue=options["max_queue"],
+                                                    timeout=options["queue_timeout"] or queue_timeout, status=429,
+                                                    adaptive=options["adaptive"])
+                        self.limiters[func["title"]] = limiter
+                        limiters.append(limiter)
+
+                    # critical route(health check, 인증 등)는 서버/namespace 제한을 받지 않음
+                    if priority != "critical":
+                        limiters += [x for x in (ns_limiter, self.limiter) if x is not None]
+
+                    # decorator wrapper 체인을 하나의 핸들러로 합쳐서 등록
+                    self.endpoint_map[func["title"]] = {
+                        "title": func["title"],
+                        "ns": ns,
+                        "func": func,
+                        "context": ns.context,
+                        "handler": compile_handler(func["func"]),
+                        "limiters": limiters,
+                        "priority": admission.PRIORITIES[priority]
+                    }
                     self.app.add_url_rule(path, func["title"], self.handle_request, methods=[method.upper(), ])
 
+        timing.mark("routes")
+
         self.app.after_request(self.after_request)
 
+        self.startup = timing.to_dict()
+        if self.app.config.get("RESTIFY_STARTUP_LOG", False):
+            self.app.logger.info("init_server %s", codec.dumps(self.startup).decode("utf-8"))
+
         return self.app
 
     def handle_request(self, *args, **kwargs):
-        if request.endpoint not in self.endpoint_map:
+        target = self.endpoint_map.get(request.endpoint)
+        if target is None:
             return Response(response="Can't find endpoint '{0}'".format(request.endpoint), status=500, mimetype="text/plain")
 
-        ns = self.endpoint_map[request.endpoint]["ns"]
-        func = self.endpoint_map[request.endpoint]["func"]
+        if self.metrics is None:
+            return self.dispatch(target, args, kwargs)
 
-        context = ns.context()  # ns.cls()
-        self.on_receive(context)
+        stats = self.metrics.begin(request.endpoint)
+        start = time.perf_counter()
+        response = None
 
         try:
-            auth_header = request.headers.get('Authorization')
-            try:
-                if auth_header and len(auth_header) > 0:
-                    context.update_authkey(auth_header.split(" ")[1])
-                else:
-                    context.update_authkey("")
-            except BaseException as e:
-                raise error.HttpError(401, str(e))
+            response = self.dispatch(target, args, kwargs)
+            return response
+        finally:
+            self.record_metrics(stats, start, response)
+
+    async def handle_request_async(self, *args, **kwargs):
+        # ASGI 이벤트 루프에서 async 핸들러를 직접 await (handle_request와 동일한 처리)
+        target = self.endpoint_map.get(request.endpoint)
+        if target is None:
+            return Response(response="Can't find endpoint '{0}'".format(request.endpoint), status=500, mimetype="text/plain")
 
-            result = func["func"](context, *args, **kwargs)
-            code = 200
+        if self.metrics is None:
+            return await self.dispatch_async(target, args, kwargs)
 
-            if isinstance(result, Response):
-                return result
+        stats = self.metrics.begin(request.endpoint)
+        start = time.perf_counter()
+        response = None
 
-            if type(result) == tuple:
-                code = result[1]
-                result = result[0]
+        try:
+            response = await self.dispatch_async(target, args, kwargs)
+            return response
+        finally:
+            self.record_metrics(stats, start, response)
+
+    def dispatch(self, target, args, kwargs):
+        limiters = target["limiters"]
+        if not limiters:
+            return self.process(target, args, kwargs)
 
-            return Response(response=json.dumps(result, ensure_ascii=False), headers=context.headers, status=code, mimetype="application/json")
+        try:
+            acquired = admission.acquire(limiters, target["priority"])
         except error.HttpError as e:
-            self.on_error(context, e)
-            return Response(response=json.dumps(e.to_dict(), ensure_ascii=False), status=e.code, mimetype="application/json")
+            return self.reject_response(e)
+
+        start = time.perf_counter()
+        try:
+            return self.process(target, args, kwargs)
+        finally:
+            admission.release(acquired, time.perf_counter() - start)
+
+    def process(self, target, args, kwargs):
+        endpoint = target["title"]
+        handler = target["handler"]
+        timing = self.start_timing()
+
+        context = target["context"]()  # ns.cls()
+        context.timing = timing
+        if timing:
+            timing.mark("context")
+
+        if self.receive_hook:
+            self.receive_hook(context)
+        if timing:
+            timing.mark("receive")
+
+        try:
+            self.authorize(context)
+            if timing:
+                timing.mark("auth")
+
+            if self.profiler and self.profiler.wanted(request):
+                result = self.profiler.run(endpoint, self.complete(handler), context, *args, **kwargs)
+            elif self.memory:
+                result = self.memory.run(endpoint, self.complete(handler), context, *args, **kwargs)
+            else:
+                result = handler(context, *args, **kwargs)
+
+                if inspect.iscoroutine(result):
+                    result = self.run_async(result)
+
+            if timing:
+                timing.mark("handler")
+
+            response = self.build_response(context, result)
+        except error.HttpError as e:
+            response = self.error_response(context, e)
         except Exception as e:
-            self.on_error(context, error.HttpError(500, e, "Internal Server Error"))
-            print(e, file=sys.stderr)
-            traceback.print_tb(e.__traceback__)
-            return Response(response=json.dumps({"caused_by": str(e)}), status=500, mimetype="application/json")
+            response = self.exception_response(context, e)
+
+        if timing:
+            timing.mark("encode")
+            self.finish_timing(endpoint, timing, response)
+
+        return response
+
+    async def dispatch_async(self, target, args, kwargs):
+        limiters = target["limiters"]
+        if not limiters:
+            return await self.process_async(target, args, kwargs)
+
+        try:
+            acquired = await admission.acquire_async(limiters, target["priority"])
+        except error.HttpError as e:
+            return self.reject_response(e)
+
+        start = time.perf_counter()
+        try:
+            return await self.process_async(target, args, kwargs)
+        finally:
+            admission.release(acquired, time.perf_counter() - start)
+
+    async def process_async(self, target, args, kwargs):
+        endpoint = target["title"]
+        handler = target["handler"]
+        timing = self.start_timing()
+
+        context = target["context"]()  # ns.cls()
+        context.timing = timing
+        if timing:
+            timing.mark("context")
+
+        if self.receive_hook:
+            self.receive_hook(context)
+        if timing:
+            timing.mark("receive")
+
+        try:
+            self.authorize(context)
+            if timing:
+                timing.mark("auth")
+
+            if self.profiler and self.profiler.wanted(request):
+                result = await self.profiler.run_async(endpoint, self.complete_async(handler), context, *args, **kwargs)
+            elif self.memory:
+                result = await self.memory.run_async(endpoint, self.complete_async(handler), context, *args, **kwargs)
+            else:
+                result = handler(context, *args, **kwargs)
+
+                if inspect.iscoroutine(result):
+                    result = await result
+
+            if timing:
+                timing.mark("handler")
+
+            response = self.build_response(context, result)
+        except error.HttpError as e:
+            response = self.error_response(context, e)
+        except Exception as e:
+            response = self.exception_response(context, e)
+
+        if timing:
+            timing.mark("encode")
+            self.finish_timing(endpoint, timing, response)
+
+        return response
+
+    def profiles_view(self, report_id=None):
+        if not self.profiler.authorized(request):
+            e = error.HttpError(403, "profiling token required")
+            return Response(response=codec.dumps(e.to_dict()), status=e.code, mimetype="application/json")
+
+        if report_id is None:
+            return Response(response=codec.dumps(self.profiler.summary()), status=200, mimetype="application/json")
+
+        report = self.profiler.get(report_id)
+        if report is None:
+            e = error.HttpError(404, "profile '{0}' not found".format(report_id))
+            return Response(response=codec.dumps(e.to_dict()), status=e.code, mimetype="application/json")
+
+        fmt = request.args.get("format", "json")
+
+        if fmt == "pstats":
+            return Response(response=report["pstats"], status=200, mimetype="application/octet-stream",
+                            headers={"Content-Disposition": "attachment; filename={0}.pstats".format(report_id)})
+
+        if fmt == "collapsed":
+            return Response(response=report["collapsed"], status=200, mimetype="text/plain")
+
+        return Response(response=codec.dumps({k: v for k, v in report.items() if k != "pstats"}), status=200, mimetype="application/json")
+
+    def start_timing(self):
+        # 비운영 환경에서는 요청 헤더로, 운영 환경에서는 sampling으로 활성화
+        if self.timing_toggle and request.headers.get("X-Server-Timing"):
+            return ServerTiming()
+
+        if self.timing_sample > 0 and (self.timing_sample >= 1 or random.random() < self.timing_sample):
+            return ServerTiming()
+
+        return None
+
+    def finish_timing(self, endpoint, timing, response):
+        response.headers["Server-Timing"] = timing.header()
+
+        if self.timing_log:
+            self.app.logger.info("server-timing %s", codec.dumps({
+                "endpoint": endpoint,
+                "status": response.status_code,
+                "phases": timing.to_dict()
+            }).decode("utf-8"))
+
+    def record_metrics(self, stats, start, response):
+        if response is None:
+            self.metrics.end(stats, time.perf_counter() - start, 500, 0)
+            return
+
+        # 스트리밍 응답은 크기를 알 수 없으므로 0으로 기록
+        size = response.content_length or 0
+        self.metrics.end(stats, time.perf_counter() - start, response.status_code, size)
+
+    def metrics_view(self):
+        extra = {}
+
+        if self.compressor:
+            extra["restify_compression_raw_bytes_total"] = ("counter", "Response bytes before compression.", self.compressor.raw_bytes)
+            extra["restify_compression_compressed_bytes_total"] = ("counter", "Response bytes after compression.", self.compressor.compressed_bytes)
+
+        if self.limiters:
+            extra["restify_admission_rejected_total"] = ("counter", "Requests rejected by admission control.",
+                                                         sum(x.rejected for x in self.limiters.values()))
+
+        body = self.metrics.render(extra)
+
+        if self.memory:
+            body += self.memory.render()
+
+        return Response(response=body, status=200, mimetype="text/plain; version=0.0.4")
+
+    def memory_view(self):
+        return Response(response=codec.dumps(self.memory.stats()), status=200, mimetype="application/json")
+
+    # noinspection PyMethodMayBeStatic
+    def authorize(self, context):
+        auth_header = request.headers.get('Authorization')
+
+        # batch 하위 요청은 같은 token을 context 종류별로 한 번만 인증하고 결과를 재사용
+        batch = request.environ.get("restify.batch_auth")
+        key = (type(context), auth_header)
+
+        if batch is not None and key in batch:
+            state = batch[key]
+            if isinstance(state, error.HttpError):
+                raise error.HttpError(state.code, state.message)
+
+            vars(context).update(state)
+            return
+
+        try:
+            if auth_header and len(auth_header) > 0:
+                context.resolve_authkey(auth_header.split(" ")[1])
+            else:
+                context.resolve_authkey("")
+        except BaseException as e:
+            if batch is not None:
+                batch[key] = error.HttpError(401, str(e))
+            raise error.HttpError(401, str(e))
+
+        # 인증 결과만 보관 (headers는 하위 요청마다 별도 dict를 사용해야 응답 header가 섞이지 않음)
+        if batch is not None:
+            batch[key] = {k: v for k, v in vars(context).items() if k not in ("timing", "headers")}
+
+    def build_response(self, context, result):
+        code = 200
+
+        if isinstance(result, Response):
+            return result
+
+        if type(result) == tuple:
+            code = result[1]
+            result = result[0]
+
+        if isinstance(result, Iterator):
+            response = self.stream_response(context, result, code)
+
+            if context.etag:
+                response.set_etag(context.etag)
+
+            return response
+
+        body = codec.dumps(result)
+        response = Response(response=body, headers=context.headers, status=code, mimetype="application/json")
+
+        if code == 200 and (self.etag or context.conditional or context.etag):
+            self.conditional_response(context, response, body)
+
+        return response
 
     # noinspection PyMethodMayBeStatic
+    def conditional_response(self, context, response, body):
+        # 핸들러가 지정한 version tag가 없으면 body hash를 ETag로 사용
+        response.set_etag(context.etag or hashlib.blake2b(body, digest_size=16).hexdigest())
+
+        if context.last_modified:
+            response.last_modified = context.last_modified
+
+        # If-None-Match / If-Modified-Since가 일치하면 304로 변환
+        response.make_conditional(request)
+
+    def error_response(self, context, e: error.HttpError):
+        self.on_error(context, e)
+        return Response(response=codec.dumps(e.to_dict()), status=e.code, headers=e.headers, mimetype="application/json")
+
+    # noinspection PyMethodMayBeStatic
+    def reject_response(self, e: error.HttpError):
+        # admission control에서 거절된 요청, context 생성 전이므로 on_error는 호출하지 않음
+        return Response(response=codec.dumps(e.to_dict()), status=e.code, headers=e.headers, mimetype="application/json")
+
+    def exception_response(self, context, e: Exception):
+        self.report_exception(context, e)
+        return Response(response=codec.dumps({"caused_by": str(e)}), status=500, mimetype="application/json")
+
+    def report_exception(self, context, e: Exception):
+        self.on_error(context, error.HttpError(500, e, "Internal Server Error"))
+        print(e, file=sys.stderr)
+        traceback.print_tb(e.__traceback__)
+
+    def complete(self, handler):
+        # profiling/메모리 추적 구간 안에서 async 핸들러의 coroutine까지 실행
+        def call(*args, **kwargs):
+            result = handler(*args, **kwargs)
+
+            if inspect.iscoroutine(result):
+                result = self.run_async(result)
+
+            return result
+
+        return call
+
+    # noinspection PyMethodMayBeStatic
+    def complete_async(self, handler):
+        async def call(*args, **kwargs):
+            result = handler(*args, **kwargs)
+
+            if inspect.iscoroutine(result):
+                result = await result
+
+            return result
+
+        return call
+
+    # noinspection PyMethodMayBeStatic
+    def run_async(self, coro):
+        # WSGI 요청 스레드에서 async 핸들러를 실행
+        import asyncio
+
+        return asyncio.run(coro)
+
+    def stream_response(self, context, result, code=200):
+        ndjson = request.accept_mimetypes.best_match(["application/json", "application/x-ndjson"]) == "application/x-ndjson"
+
+        # 첫번째 항목은 응답 전에 꺼내서 핸들러 초기 오류가 일반 오류 응답으로 처리되도록 함
+        end = object()
+        first = next(result, end)
+
+        def generate():
+            try:
+                if ndjson:
+                    if first is not end:
+                        yield codec.dumps(first) + b"\n"
+
+                    for item in result:
+                        yield codec.dumps(item) + b"\n"
+                else:
+                    if first is end:
+                        yield b"[]"
+                        return
+
+                    yield b"[" + codec.dumps(first)
+
+                    for item in result:
+                        yield b"," + codec.dumps(item)
+
+                    yield b"]"
+            except error.HttpError as e:
+                # 이미 응답이 시작되었으므로 스트림을 중단하고 오류만 보고
+                self.on_error(context, e)
+            except Exception as e:
+                self.report_exception(context, e)
+
+        mimetype = "application/x-ndjson" if ndjson else "application/json"
+        return Response(response=stream_with_context(generate()), headers=context.headers, status=code, mimetype=mimetype)
+
+    def serve(self, host="0.0.0.0", port=5000, workers=None, config=None, **kwargs):
+        # pre-fork 방식의 운영 서버 실행 (fork를 지원하는 POSIX 환경 전용)
+        # kwargs: max_requests, max_requests_jitter, graceful_timeout, backlog
+        from flask_restify.prefork import PreforkServer
+
+        # init_server()가 끝나면 startup이 기록됨 (route가 없어 endpoint_map이 비어 있어도 다시 초기화하지 않음)
+        if self.startup is None:
+            if config:
+                self.init_server(config)
+            else:
+                self.init_server()
+
+        PreforkServer(self, host, port, workers, **kwargs).run()
+
+    def asgi_app(self, max_workers=None):
+        # init_server() 이후 호출, uvicorn/hypercorn 등에서 사용할 ASGI 앱 반환
+        from flask_restify.asgi import ASGIApp
+
+        return ASGIApp(self, max_workers=max_workers)
+
+    def swagger_json(self):
+        payload = self.docs.encoded()
+
+        if request.accept_encodings.quality("gzip") > 0:
+            body, etag = payload["gzip"], payload["etag"] + "-gzip"
+            headers = {"Content-Encoding": "gzip"}
+        else:
+            body, etag = payload["body"], payload["etag"]
+            headers = {}
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304, headers=headers)
+        else:
+            response = Response(response=body, status=200, headers=headers, mimetype="application/json")
+
+        response.set_etag(etag)
+        response.vary.add("Accept-Encoding")
+
+        return response
+
     def after_request(self, response):
         header = response.headers
         header['Access-Control-Allow-Origin'] = '*'
@@ -117,6 +682,9 @@ class BaseAPI:
         if id:
             header["X-Request-ID"] = id
 
+        if self.compressor:
+            response = self.compressor.compress(request, response)
+
         return response
 
     def add_namespace(self, ns):
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+from flask import request
+from werkzeug.exceptions import HTTPException
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+import inspect
+import io
+import sys
+
+
+class ASGIApp:
+    # BaseAPI를 ASGI 서버에서 구동하기 위한 어댑터
+    # - async 핸들러: 이벤트 루프에서 직접 실행
+    # - 그 외 (sync 핸들러, swagger, docs 등): Flask WSGI 앱을 제한된 thread pool에서 실행
+
+    def __init__(self, api, max_workers=None):
+        self.api = api
+        self.app = api.app
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="restify-asgi")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+
+        if scope["type"] != "http":
+            raise NotImplementedError("unsupported scope type '{0}'".format(scope["type"]))
+
+        environ = self.build_environ(scope, await self.read_body(receive))
+
+        if self.is_async_endpoint(environ):
+            await self.call_async(environ, send)
+        else:
+            await self.call_wsgi(environ, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # noinspection PyMethodMayBeStatic
+    async def read_body(self, receive):
+        body = b""
+
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+
+            if not message.get("more_body", False):
+                return body
+
+    # noinspection PyMethodMayBeStatic
+    def build_environ(self, scope, body):
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client")
+
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin1"),
+            "PATH_INFO": scope["path"].encode("utf-8").decode("latin1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": "HTTP/{0}".format(scope.get("http_version", "1.1")),
+            "REMOTE_ADDR": client[0] if client else "",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False
+        }
+
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin1").upper().replace("-", "_")
+            value = value.decode("latin1")
+
+            if name == "CONTENT_LENGTH":
+                continue
+
+            if name != "CONTENT_TYPE":
+                name = "HTTP_" + name
+
+            if name in environ:
+                value = environ[name] + "," + value
+
+            environ[name] = value
+
+        return environ
+
+    def is_async_endpoint(self, environ):
+        try:
+            endpoint, _ = self.app.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return False
+
+        target = self.api.endpoint_map.get(endpoint)
+
+        return target is not None and inspect.iscoroutinefunction(target["handler"])
+
+    async def call_async(self, environ, send):
+        ctx = self.app.request_context(environ)
+        ctx.push()
+
+        try:
+            try:
+                rv = self.app.preprocess_request()
+
+                if rv is None:
+                    rv = await self.api.handle_request_async(**request.view_args)
+            except Exception as e:
+                rv = self.app.handle_user_exception(e)
+
+            response = self.app.finalize_request(rv)
+
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": self.encode_headers(response.headers.items())
+            })
+
+            # 스트리밍 응답은 같은 task 안에서 순서대로 전송
+            for chunk in response.iter_encoded():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            ctx.pop()
+
+    async def call_wsgi(self, environ, send):
+        loop = asyncio.get_running_loop()
+
+        # 요청 하나의 모든 단계를 같은 context에서 실행하여 Flask 요청 context가 유지되도록 함
+        context = contextvars.copy_context()
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = headers
+
+        def run(f, *args):
+            return loop.run_in_executor(self.executor, context.run, f, *args)
+
+        iterable = await run(self.app, environ, start_response)
+        iterator = iter(iterable)
+        end = object()
+
+        try:
+            chunk = await run(next, iterator, end)
+
+            await send({
+                "type": "http.response.start",
+                "status": started["status"],
+                "headers": self.encode_headers(started["headers"])
+            })
+
+            while chunk is not end:
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+                chunk = await run(next, iterator, end)
+
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            if hasattr(iterable, "close"):
+                await run(iterable.close)
+
+    # noinspection PyMethodMayBeStatic
+    def encode_headers(self, headers):
+        return [(k.lower().encode("latin1"), v.encode("latin1")) for k, v in headers]
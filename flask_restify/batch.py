@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+from flask import request, Response
+from flask_restify.util import error, codec
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+_safe_methods = ["GET", "HEAD", "OPTIONS"]
+
+
+class Batch:
+    # 여러 개의 하위 요청을 한 번의 HTTP 요청으로 처리
+    # - 요청 형식: [{method, path, query, headers, body}, ...] 또는 {"requests": [...], "concurrent": bool}
+    # - 연속된 조회(GET/HEAD) 요청은 동시에, 변경 요청은 순서대로 실행
+    # - 같은 Authorization은 context 종류별로 한 번만 인증
+
+    def __init__(self, api, limit=50, workers=4):
+        self.api = api
+        self.limit = limit
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restify-batch") if workers > 1 else None
+
+    def view(self):
+        data = request.get_json(silent=True)
+        concurrent = True
+
+        if isinstance(data, dict):
+            concurrent = data.get("concurrent", True)
+            data = data.get("requests")
+
+        if not isinstance(data, list) or not all(isinstance(x, dict) for x in data):
+            return self.error(error.HttpError(400, "batch body must be a list of requests"))
+
+        if len(data) > self.limit:
+            return self.error(error.HttpError(400, "too many requests in batch (limit {0})".format(self.limit)))
+
+        base_headers = {}
+        if request.headers.get("Authorization"):
+            base_headers["Authorization"] = request.headers["Authorization"]
+
+        auth = {}
+        results = [None] * len(data)
+
+        for group in self.groups(data, concurrent and self.executor is not None):
+            if len(group) == 1:
+                i = group[0]
+                results[i] = self.execute(data[i], base_headers, auth)
+            else:
+                futures = [(i, self.executor.submit(self.execute, data[i], base_headers, auth)) for i in group]
+                for i, future in futures:
+                    results[i] = future.result()
+
+        return Response(response=codec.dumps(results), status=200, mimetype="application/json")
+
+    # noinspection PyMethodMayBeStatic
+    def groups(self, items, concurrent):
+        # 조회 요청끼리 묶어서 동시에 실행할 그룹 구성, 변경 요청은 단독 그룹
+        groups = []
+        current = []
+
+        for i, item in enumerate(items):
+            method = str(item.get("method", "GET")).upper()
+
+            if concurrent and method in _safe_methods:
+                current.append(i)
+                continue
+
+            if current:
+                groups.append(current)
+                current = []
+
+            groups.append([i])
+
+        if current:
+            groups.append(current)
+
+        return groups
+
+    def execute(self, item, base_headers, auth):
+        method = str(item.get("method", "GET")).upper()
+        path = item.get("path", "")
+        query = item.get("query") or {}
+
+        headers = dict(base_headers)
+        headers.update(item.get("headers") or {})
+
+        if "?" in path:
+            path, qs = path.split("?", 1)
+        else:
+            qs = ""
+
+        if query:
+            qs = (qs + "&" if qs else "") + urlencode(query, doseq=True)
+
+        options = {
+            "method": method,
+            "headers": headers,
+            "query_string": qs,
+            "environ_overrides": {"restify.batch_auth": auth}
+        }
+
+        if item.get("body") is not None:
+            options["json"] = item["body"]
+
+        with self.api.app.test_request_context(path, **options):
+            if request.routing_exception is not None:
+                code = getattr(request.routing_exception, "code", 404)
+                return self.item(error.HttpError(code, "can't resolve '{0} {1}'".format(method, path)))
+
+            if request.endpoint not in self.api.endpoint_map:
+                return self.item(error.HttpError(404, "can't resolve '{0} {1}'".format(method, path)))
+
+            response = self.api.handle_request(**request.view_args)
+
+            # 스트리밍 응답도 요청 context 안에서 모두 소비
+            body = response.get_data()
+
+        if response.mimetype in ["application/json", "application/x-ndjson"] and body:
+            try:
+                body = codec.loads(body) if response.mimetype == "application/json" else body.decode("utf-8")
+            except ValueError:
+                body = body.decode("utf-8", "replace")
+        else:
+            body = body.decode("utf-8", "replace")
+
+        headers = {k: v for k, v in response.headers.items() if k not in ["Content-Length", "Content-Type"]}
+
+        return {"status": response.status_code, "headers": headers, "body": body}
+
+    # noinspection PyMethodMayBeStatic
+    def item(self, e: error.HttpError):
+        return {"status": e.code, "headers": {}, "body": e.to_dict()}
+
+    # noinspection PyMethodMayBeStatic
+    def error(self, e: error.HttpError):
+        return Response(response=codec.dumps(e.to_dict()), status=e.code, mimetype="application/json")
+
+    # noinspection PyMethodMayBeStatic
+    def swagger(self):
+        item = {
+            "type": "object",
+            "properties": {
+                "method": {"type": "string", "enum": ["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"], "default": "GET"},
+                "path": {"type": "string", "example": "/api/items/1"},
+                "query": {"type": "object"},
+                "headers": {"type": "object"},
+                "body": {}
+            },
+            "required": ["path"]
+        }
+
+        result = {
+            "type": "object",
+            "properties": {
+                "status": {"type": "integer", "format": "int32"},
+                "headers": {"type": "object"},
+                "body": {}
+            }
+        }
+
+        return {
+            "operationId": "flask_restify.batch",
+            "summary": "batch",
+            "description": "Executes several API requests in one round trip. "
+                           "Consecutive GET/HEAD requests run concurrently unless 'concurrent' is false.",
+            "tags": ["batch"],
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "oneOf": [
+                                {"type": "array", "items": item},
+                                {
+                                    "type": "object",
+                                    "properties": {
+                                        "requests": {"type": "array", "items": item},
+                                        "concurrent": {"type": "boolean", "default": True}
+                                    },
+                                    "required": ["requests"]
+                                }
+                            ]
+                        }
+                    }
+                }
+            },
+            "responses": {
+                200: {
+                    "description": "results in request order",
+                    "content": {"application/json": {"schema": {"type": "array", "items": result}}}
+                },
+                400: {"description": "invalid batch request"}
+            },
+            "security": [{"auth": []}]
+        }
@@ -3,8 +3,15 @@
 from flask_restify.resource.namespace import Namespace
 
 from flask_restify import fields
+from flask_restify.util import codec
 
 import re
+import inspect
+import gzip
+import hashlib
+import json
+import threading
+import time
 
 
 class SwaggerDoc:
@@ -19,25 +26,63 @@ class SwaggerDoc:
         self.description = description
         self.version = version
 
+        self._encoded = None
+
+        # tag -> (path, namespace), 문서가 요청될 때까지 operation 생성을 미룸
+        self._pending = {}
+        self.build_times = {}
+
+        # 첫 요청들이 동시에 들어와도 생성 중인 문서를 직렬화하지 않도록 생성/직렬화를 직렬화
+        self._lock = threading.RLock()
+
     def add_namespace(self, path: str, ns: Namespace):
         # 1. 이미 있나 확인 후
         if ns.tag in self.namespace:
             raise Exception("Namespace '{0}' already exists.".format(ns.tag))
 
+        # 2. 경로 중복만 먼저 확인하고, operation 문서는 처음 요청될 때 namespace 단위로 생성
+        paths = [path + re.sub(r"<(.*?)>", r"{\g<1>}", route) for route in ns.routes]
+
+        for full_path in paths:
+            if full_path in self.path:
+                raise Exception("Path '{0}' already exists.".format(full_path))
+
         self.namespace[ns.tag] = {
             "name": ns.tag,
             "description": ns.description
         }
 
+        for full_path in paths:
+            self.path[full_path] = {}
+
+        self._pending[ns.tag] = (path, ns)
+
+        # 문서가 변경되므로 캐시된 payload 폐기
+        self._encoded = None
+
+    def build(self):
+        # 아직 문서화되지 않은 namespace의 operation 생성
+        if not self._pending:
+            return
+
+        with self._lock:
+            while self._pending:
+                tag, (path, ns) = next(iter(self._pending.items()))
+
+                started = time.perf_counter()
+                self._build_namespace(path, ns)
+                self.build_times[tag] = time.perf_counter() - started
+
+                # 생성이 끝난 뒤에 제거해야 다른 thread가 미완성 문서를 사용하지 않음
+                del self._pending[tag]
+
+    def _build_namespace(self, path: str, ns: Namespace):
         for route, methods in ns.routes.items():
             route = re.sub(r"<(.*?)>", r"{\g<1>}", route)
 
             full_path = path+route
 
-            if full_path in self.path:
-                raise Exception("Path '{0}' already exists.".format(full_path))
-
-            self.path[full_path] = {}
+            target = self.path.setdefault(full_path, {})
             for method, data in methods.items():
                 params = []
                 bodies = {}
@@ -62,16 +107,25 @@ class SwaggerDoc:
                         "description": res["description"]
                     }
 
-                    if type(res["model"]) == dict:
-                        res["model"] = fields.Object(data=res["model"])
-                    elif type(res["model"]) == list:
-                        res["model"] = fields.Array(item=res["model"][0])
+                    model = res["model"]
+                    if type(model) == dict:
+                        model = fields.Object(data=model)
+                    elif type(model) == list:
+                        item = model[0]
+                        if type(item) == dict:
+                            item = fields.Object(data=item)
+
+                        model = fields.Array(item=item)
 
-                    if isinstance(res["model"], (fields.Object, fields.Array)):
+                    if isinstance(model, (fields.Object, fields.Array)):
                         d["content"] = {
-                            "application/json": res["model"].get_swagger(for_response=True)
+                            "application/json": model.get_swagger(for_response=True)
                         }
 
+                        # generator 핸들러는 NDJSON 스트림으로도 응답 가능
+                        if isinstance(model, fields.Array) and inspect.isgeneratorfunction(inspect.unwrap(data["func"])):
+                            d["content"]["application/x-ndjson"] = model.item.get_swagger(for_response=True)
+
                     responses[code] = d
 
                 oper = {
@@ -106,7 +160,18 @@ class SwaggerDoc:
                 if data["func"].auth:
                     oper["security"] = [{"auth": []}]
 
-                self.path[full_path][method] = oper
+                if getattr(data["func"], "cache_policy", None):
+                    oper["x-cache"] = data["func"].cache_policy
+
+                target[method] = oper
+
+    def add_path(self, path: str, method: str, oper: dict):
+        # namespace에 속하지 않는 내장 endpoint(batch 등) 문서 추가
+        if method in self.path.get(path, {}):
+            raise Exception("Path '{0}' already exists.".format(path))
+
+        self.path.setdefault(path, {})[method] = oper
+        self._encoded = None
 
     def _info(self):
         return {
@@ -116,6 +181,7 @@ class SwaggerDoc:
         }
 
     def _path(self):
+        self.build()
         return self.path
 
     def to_json(self):
@@ -124,22 +190,167 @@ class SwaggerDoc:
         for tag, ns in self.namespace.items():
             tags.append(ns)
 
+        paths, schemas = extract_schemas(self._path())
+
+        components = {
+            "securitySchemes": {
+                "auth": {
+                    "type": "http",
+                    "scheme": "bearer",
+                    "bearerFormat": "JWT"
+                }
+            }
+        }
+
+        if schemas:
+            components["schemas"] = schemas
+
         return {
             "openapi": "3.0.0",
             "info": self._info(),
-            "paths": self._path(),
-            "components": {
-                "securitySchemes": {
-                    "auth": {
-                        "type": "http",
-                        "scheme": "bearer",
-                        "bearerFormat": "JWT"
-                    }
-                }
-            },
+            "paths": paths,
+            "components": components,
             "tags": tags
         }
 
+    def encoded(self):
+        # 직렬화 + gzip 압축된 문서를 namespace가 추가되기 전까지 재사용
+        encoded = self._encoded
+        if encoded is not None:
+            return encoded
+
+        with self._lock:
+            if self._encoded is None:
+                body = codec.dumps(self.to_json())
+                etag = hashlib.sha1(body).hexdigest()
+
+                self._encoded = {
+                    "body": body,
+                    "gzip": gzip.compress(body, mtime=0),
+                    "etag": etag
+                }
+
+            return self._encoded
+
+
+def extract_schemas(paths: dict):
+    # 두 번 이상 사용된 object schema를 components/schemas로 옮기고 $ref로 참조
+    # (생성된 operation 문서는 변경하지 않고 새 dict를 반환)
+    counts = {}
+    hints = {}
+    keys = {}
+
+    def key_of(schema):
+        # 같은 dict는 한 번만 직렬화
+        key = keys.get(id(schema))
+        if key is None:
+            key = keys[id(schema)] = json.dumps(schema, sort_keys=True, default=str)
+
+        return key
+
+    def is_object(schema):
+        return type(schema) == dict and schema.get("type") == "object" and schema.get("properties")
+
+    def count(schema, hint):
+        if type(schema) != dict:
+            return
+
+        if is_object(schema):
+            key = key_of(schema)
+            counts[key] = counts.get(key, 0) + 1
+            hints.setdefault(key, hint)
+
+            for k, v in schema["properties"].items():
+                count(v, k)
+
+        if "items" in schema:
+            count(schema["items"], hint + "_item")
+
+    def each_schema(oper, visit):
+        op = oper.get("operationId", "").rsplit(".", 1)[-1]
+
+        body = oper.get("requestBody", {}).get("content", {})
+        for mime, media in body.items():
+            if "schema" in media:
+                visit(media, op + "_body")
+
+        for code, res in oper.get("responses", {}).items():
+            for mime, media in res.get("content", {}).items():
+                if "schema" in media:
+                    visit(media, op + "_response")
+
+    for methods in paths.values():
+        for oper in methods.values():
+            each_schema(oper, lambda media, hint: count(media["schema"], hint))
+
+    if not any(c > 1 for c in counts.values()):
+        return paths, {}
+
+    names = {}
+    schemas = {}
+
+    def name_of(key):
+        if key not in names:
+            name = _camel(hints[key]) or "Schema"
+            base, i = name, 2
+            while name in schemas or name in names.values():
+                name = "{0}{1}".format(base, i)
+                i += 1
+
+            names[key] = name
+
+        return names[key]
+
+    def replace(schema):
+        if type(schema) != dict:
+            return schema
+
+        result = schema
+
+        if is_object(schema):
+            result = dict(schema, properties={k: replace(v) for k, v in schema["properties"].items()})
+
+        if "items" in schema:
+            result = dict(result, items=replace(schema["items"]))
+
+        if is_object(schema) and counts[key_of(schema)] > 1:
+            name = name_of(key_of(schema))
+            schemas[name] = result
+
+            return {"$ref": "#/components/schemas/" + name}
+
+        return result
+
+    def rewrite(oper):
+        oper = dict(oper)
+
+        if "requestBody" in oper:
+            content = {mime: dict(media, schema=replace(media["schema"])) if "schema" in media else media
+                       for mime, media in oper["requestBody"].get("content", {}).items()}
+            oper["requestBody"] = dict(oper["requestBody"], content=content)
+
+        if "responses" in oper:
+            responses = {}
+            for code, res in oper["responses"].items():
+                if "content" in res:
+                    content = {mime: dict(media, schema=replace(media["schema"])) if "schema" in media else media
+                               for mime, media in res["content"].items()}
+                    res = dict(res, content=content)
+
+                responses[code] = res
+
+            oper["responses"] = responses
+
+        return oper
+
+    result = {path: {method: rewrite(oper) for method, oper in methods.items()} for path, methods in paths.items()}
+
+    return result, schemas
+
+
+def _camel(name):
+    return "".join(x[:1].upper() + x[1:] for x in re.split(r"[^0-9A-Za-z]+", str(name)))
+
 
 def parameterize(model: dict):
     result = []
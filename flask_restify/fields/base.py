@@ -1,8 +1,62 @@
 # -*- coding: utf-8 -*-
 import json
+import types
 
+from flask_restify.util import codec
 
-class Field:
+_slot = types.MemberDescriptorType
+
+
+class FieldMeta(type):
+    # class 정의 시점에 설정 가능한 class 변수를 수집하여 __slots__로 변환하고, 기본값은 _defaults에 보관
+    # (상위 class에서 선언된 이름은 class 등 호출 가능한 값이어도 기본값 재정의로 취급, _로 시작하는 이름은 class 변수로 유지)
+    # class에서 읽으면 slot descriptor 대신 기본값을 반환 (예: JWT.pattern)
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        defaults = {}
+        for base in reversed(bases):
+            defaults.update(getattr(base, "_defaults", {}))
+
+        inherited = set(defaults)
+
+        for k, v in list(namespace.items()):
+            if k.startswith("_"):
+                continue
+
+            if hasattr(v, "__get__"):
+                # property/method 등으로 재정의한 상위 class의 설정값은 __init__에서 설정하지 않음
+                defaults.pop(k, None)
+            elif k in inherited or not callable(v):
+                defaults[k] = namespace.pop(k)
+
+        slots = tuple(k for k in defaults if k not in inherited)
+
+        # package 밖에서 정의한 하위 class는 __init__ 등에서 임의의 속성을 추가할 수 있도록 __dict__ 허용
+        external = not namespace.get("__module__", "").startswith("flask_restify.")
+        if external and all(base.__dictoffset__ == 0 for base in bases):
+            slots += ("__dict__",)
+
+        namespace["__slots__"] = slots
+        namespace["_defaults"] = defaults
+
+        # validation()만 재정의한 경우 상위 class의 compile()은 재정의된 검증을 반영하지 못하므로 validation()을 그대로 사용
+        if "validation" in namespace and "compile" not in namespace:
+            namespace["compile"] = _compile_validation(namespace["validation"])
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __getattribute__(cls, name):
+        # instance의 속성 조회는 거치지 않으므로 class에서 직접 읽는 경우에만 비용이 있음
+        value = super().__getattribute__(name)
+
+        if type(value) is _slot and not name.startswith("_"):
+            defaults = super().__getattribute__("_defaults")
+            if name in defaults:
+                return defaults[name]
+
+        return value
+
+
+class Field(metaclass=FieldMeta):
     description = ""
     default = None
     optional = False
@@ -12,12 +66,8 @@ class Field:
     enum = []
 
     def __init__(self, **kwargs):
-        for k in self.__get_class_variables():
-            if k in kwargs:
-                vars(self)[k] = kwargs[k]
-
-    def __get_class_variables(self):
-        return [attr for attr in dir(self) if not callable(getattr(self, attr)) and not attr.startswith("__")]
+        for k, v in self._defaults.items():
+            setattr(self, k, kwargs.get(k, v))
 
     def get_swagger(self, for_response=False):
         data = {}
@@ -69,6 +119,43 @@ class Field:
 
         return data
 
+    def compile(self):
+        # validation()과 동일한 검증을 수행하는 함수를 미리 구성하여 반환
+        default = self.default
+        required = not self.optional
+        enum = self.enum if self.enum and len(self.enum) > 0 else None
+        members = _member_set(enum)
+
+        if default is None and not required and enum is None:
+            return _passthrough
+
+        def validate(data):
+            if data is None:
+                if default is not None:
+                    return default
+
+                if required:
+                    raise RequiredFieldException()
+            elif enum is not None:
+                try:
+                    accepted = data in members
+                except TypeError:
+                    accepted = data in enum
+
+                if not accepted:
+                    raise ValidationException("only accept one of '{0}'s".format(enum))
+
+            return data
+
+        return validate
+
+    def compile_bulk(self):
+        # 배열 원소로 사용될 때 배열 전체를 한 번에 변환/검증하는 함수 (지원하지 않으면 None)
+        return None
+
+    def pack(self, values, packed):
+        raise TypeError("'{0}' items can't be packed as '{1}'".format(type(self).__name__, packed))
+
     def make_optional(self):
         self.optional = True
 
@@ -113,7 +200,7 @@ class Object(Field):
         if data is not None:
             if type(data) == str:
                 try:
-                    data = json.loads(data)
+                    data = codec.loads(data)
                 except json.JSONDecodeError as e:
                     raise ValidationException("invalid object")
         else:
@@ -132,9 +219,34 @@ class Object(Field):
 
         return data
 
+    def compile(self):
+        check = super().compile()
+        items = [(k, v.compile()) for k, v in self.data.items()]
+
+        def validate(data):
+            if data is None:
+                return check(None)
+
+            if type(data) == str:
+                try:
+                    data = codec.loads(data)
+                except json.JSONDecodeError as e:
+                    raise ValidationException("invalid object")
+
+            for k, v in items:
+                try:
+                    data[k] = v(data.get(k))
+                except BaseException as e:
+                    raise ValidationException(f"invalid format '{k}'")
+
+            return check(data)
+
+        return validate
+
 
 class Array(Field):
     item: Field = None
+    packed = None  # 숫자 배열을 list 대신 "array"(array.array) 또는 "numpy"(ndarray)로 전달
 
     def get_scheme(self):
         data = {
@@ -155,18 +267,90 @@ class Array(Field):
         if data is not None:
             if type(data) == str:
                 try:
-                    data = json.loads(data)
+                    data = codec.loads(data)
                 except json.JSONDecodeError as e:
                     raise ValidationException("invalid array")
         else:
             return None
 
-        for i, v in enumerate(data):
-            data[i] = self.item.validation(v)
+        bulk = self.item.compile_bulk()
+        values = bulk(data) if bulk is not None and type(data) == list else None
+
+        if values is None:
+            for i, v in enumerate(data):
+                data[i] = self.item.validation(v)
+
+            values = data
+
+        return self._pack(data, values)
+
+    def compile(self):
+        check = super().compile()
+        item = self.item.compile()
+        bulk = self.item.compile_bulk()
+        pack = self._pack
+
+        if self.packed:
+            # numpy가 없는 등 packing이 불가능한 설정은 선언 시점에 오류 발생
+            self.item.pack([], self.packed)
+
+        def validate(data):
+            data = check(data)
+
+            if data is None:
+                return None
+
+            if type(data) == str:
+                try:
+                    data = codec.loads(data)
+                except json.JSONDecodeError as e:
+                    raise ValidationException("invalid array")
+
+            values = bulk(data) if bulk is not None and type(data) == list else None
+
+            if values is None:
+                data[:] = [item(v) for v in data]
+                values = data
+
+            return pack(data, values)
+
+        return validate
+
+    def _pack(self, data, values):
+        # 일괄 변환 결과(list/ndarray)를 지정된 형태로 변환, 기본값은 입력 list를 그대로 갱신
+        if self.packed:
+            try:
+                return self.item.pack(values, self.packed)
+            except (TypeError, OverflowError):
+                raise ValidationException("invalid array")
+
+        if values is not data:
+            data[:] = values if type(values) == list else values.tolist()
 
         return data
 
 
+def _compile_validation(validation):
+    def compile(self):
+        return lambda data: validation(self, data)
+
+    return compile
+
+
+def _passthrough(data):
+    return data
+
+
+def _member_set(values):
+    if values is None:
+        return None
+
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+
 class ValidationException(BaseException):
     pass
 
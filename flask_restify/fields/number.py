@@ -2,6 +2,22 @@
 
 from .base import Field, ValidationException
 
+import array
+
+try:
+    import numpy
+except ImportError:  # numpy가 없으면 순수 python으로 일괄 변환
+    numpy = None
+
+# 이 크기 이상의 배열은 numpy로 변환 및 범위 검증
+NUMPY_THRESHOLD = 1024
+
+# 변환 타입 -> (array.array typecode, numpy dtype)
+_typecodes = {
+    int: ("q", "int64"),
+    float: ("d", "float64")
+}
+
 
 class Boolean(Field):
     def get_scheme(self):
@@ -28,9 +44,30 @@ class Boolean(Field):
 
         return super().validation(data)
 
+    def compile(self):
+        check = super().compile()
+        truthy = (1, "1", "true", "yes")
+
+        def validate(data):
+            if data is None:
+                return check(None)
+
+            if type(data) == str:
+                data = data.lower() in truthy
+
+            try:
+                data = bool(data)
+            except (TypeError, ValueError):
+                data = None
+
+            return check(data)
+
+        return validate
+
 
 class Number(Field):
     range = None  # 값 입력 범위
+    _convert = None  # 배열 일괄 변환에 사용할 타입 (int / float)
 
     def get_scheme(self):
         data = super().get_scheme()
@@ -67,8 +104,126 @@ class Number(Field):
 
         return data
 
+    def compile(self):
+        check = super().compile()
+
+        if not self.range:
+            return check
+
+        if type(self.range) != dict:
+            def validate(data):
+                data = check(data)
+
+                if data is not None:
+                    raise TypeError()
+
+                return data
+
+            return validate
+
+        lo = self.range.get("min")
+        hi = self.range.get("max")
+        has_lo = "min" in self.range
+        has_hi = "max" in self.range
+
+        def validate(data):
+            data = check(data)
+
+            if data is not None:
+                if has_lo and data < lo:
+                    raise RangeException()
+
+                if has_hi and data > hi:
+                    raise RangeException()
+
+            return data
+
+        return validate
+
+    def compile_bulk(self):
+        # 배열 전체를 한 번에 변환하고 min/max로 범위 검증
+        # 변환할 수 없는 원소가 있으면 None을 반환하여 원소 단위 검증(default/optional 처리)으로 넘김
+        convert = self._convert
+
+        if convert is None or (self.enum and len(self.enum) > 0):
+            return None
+
+        # _convert를 지정한 class(Integer/Float)의 검증을 그대로 사용하는 경우만 일괄 변환 (재정의된 검증은 원소 단위로 수행)
+        cls = type(self)
+        owner = next(x for x in cls.__mro__ if "_convert" in x.__dict__)
+        if cls.validation is not owner.validation or cls.compile is not owner.compile:
+            return None
+
+        if self.range and type(self.range) != dict:
+            return None
+
+        lo = self.range.get("min") if self.range else None
+        hi = self.range.get("max") if self.range else None
+        has_lo = bool(self.range) and "min" in self.range
+        has_hi = bool(self.range) and "max" in self.range
+        dtype = _typecodes[convert][1]
+
+        def vectorized(data):
+            # None 등이 섞여 object 배열이 되면 원소 단위로 처리
+            values = numpy.asarray(data)
+
+            if values.ndim != 1 or values.dtype.kind not in "iufbU":
+                return None
+
+            if convert is int and values.dtype.kind == "f":
+                # int()와 동일하게 소수점 이하를 버리되, 정밀도를 잃거나 변환할 수 없는 값은 원소 단위로 처리
+                if not numpy.isfinite(values).all() or (len(values) and numpy.abs(values).max() >= 2 ** 53):
+                    return None
+
+            return values.astype(dtype)
+
+        def validate(data):
+            try:
+                if numpy is not None and len(data) >= NUMPY_THRESHOLD:
+                    values = vectorized(data)
+                else:
+                    values = list(map(convert, data))
+            except (TypeError, ValueError, OverflowError):
+                return None
+
+            if values is None:
+                return None
+
+            if len(values):
+                if has_lo and _lowest(values) < lo:
+                    raise RangeException()
+
+                if has_hi and _highest(values) > hi:
+                    raise RangeException()
+
+            return values
+
+        return validate
+
+    def pack(self, values, packed):
+        if self._convert is None:
+            return super().pack(values, packed)
+
+        typecode, dtype = _typecodes[self._convert]
+
+        if packed == "numpy":
+            if numpy is None:
+                raise ImportError("numpy is required for packed='numpy'")
+
+            return numpy.asarray(values, dtype=dtype)
+
+        if packed == "array":
+            if numpy is not None and isinstance(values, numpy.ndarray):
+                return array.array(typecode, values.astype(dtype).tobytes())
+
+            return array.array(typecode, values)
+
+        return super().pack(values, packed)
+
 
 class Integer(Number):
+    _convert = int
+
     def get_scheme(self):
         data = super().get_scheme()
 
@@ -87,8 +242,23 @@ class Integer(Number):
 
         return super().validation(data)
 
+    def compile(self):
+        number = super().compile()
+
+        def validate(data):
+            try:
+                data = int(data)
+            except (TypeError, ValueError):
+                data = None
+
+            return number(data)
+
+        return validate
+
 
 class Float(Number):
+    _convert = float
+
     def get_scheme(self):
         data = super().get_scheme()
 
@@ -107,6 +277,42 @@ class Float(Number):
 
         return super().validation(data)
 
+    def compile(self):
+        number = super().compile()
+
+        def validate(data):
+            try:
+                data = float(data)
+            except (TypeError, ValueError):
+                data = None
+
+            return number(data)
+
+        return validate
+
+
+def _lowest(values):
+    # 원소 단위 검증과 동일하게 NaN은 범위 검사를 통과하므로 NaN을 제외한 최솟값 사용
+    if type(values) != list:
+        return numpy.fmin.reduce(values)
+
+    low = min(values)
+    if low != low:
+        low = min((v for v in values if v == v), default=low)
+
+    return low
+
+
+def _highest(values):
+    if type(values) != list:
+        return numpy.fmax.reduce(values)
+
+    high = max(values)
+    if high != high:
+        high = max((v for v in values if v == v), default=high)
+
+    return high
+
 
 class RangeException(ValidationException):
     def __init__(self):
@@ -56,6 +56,41 @@ class String(Field):
 
         return None
 
+    def compile(self):
+        check = super().compile()
+
+        lo = hi = None
+        if self.length:
+            if type(self.length) == dict:
+                lo = self.length.get("min")
+                hi = self.length.get("max")
+            elif type(self.length) == int:
+                lo = hi = self.length
+
+        match = re.compile(self.pattern).match if self.pattern else None
+
+        if lo is None and hi is None and match is None:
+            return check
+
+        def validate(data):
+            data = check(data)
+
+            if data is None:
+                return None
+
+            if lo is not None and len(data) < lo:
+                raise LengthNotMatchException()
+
+            if hi is not None and len(data) > hi:
+                raise LengthNotMatchException()
+
+            if match is not None and not match(data):
+                raise PatternNotMatchException()
+
+            return data
+
+        return validate
+
 
 class Enum(String):
     type = None
@@ -83,13 +118,43 @@ class Enum(String):
 
         return self.find(self.type, data)
 
+    def compile(self):
+        string = super().compile()
+        nullstr = self.nullstr
+        enum_type = self.type
+        members = _members(enum_type)
+
+        def validate(data):
+            data = string(data)
+
+            if data is None:
+                return None
+
+            if nullstr is not None and data == nullstr:
+                return None
+
+            if type(data) == enum_type:
+                return data
+
+            try:
+                return members[data.lower()]
+            except KeyError:
+                raise ValidationException("only accept one of '{0}'s".format(list(members)))
+
+        return validate
+
     @classmethod
     def mapping(cls, type, value):
         return next(e.name.lower() for e in type if e.value == value)
 
     @classmethod
     def find(cls, type, name):
-        return next(e for e in type if e.name.lower() == name.lower())
+        members = _members(type)
+        key = name.lower()
+        if key in members:
+            return members[key]
+
+        return next(e for e in type if e.name.lower() == key)
 
 
 class JWT(String):
@@ -97,6 +162,17 @@ class JWT(String):
     signature = ""
 
 
+_enum_members = {}
+
+
+def _members(type):
+    # enum 이름(소문자) -> 멤버 조회 테이블, enum 타입별로 한 번만 생성
+    if type not in _enum_members:
+        _enum_members[type] = {e.name.lower(): e for e in type}
+
+    return _enum_members[type]
+
+
 class LengthNotMatchException(ValidationException):
     pass
 
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+# swagger 문서를 기반으로 모든 operation에 유효한 요청을 생성하여 부하를 발생시키는 도구
+#
+#   python -m flask_restify.loadtest myservice.app:api --config app.config.TestConfig   # in-process
+#   python -m flask_restify.loadtest --url http://localhost:5000                         # localhost 서버
+
+from urllib.parse import urlencode, urlsplit
+import argparse
+import http.client
+import importlib
+import json
+import math
+import random
+import re
+import string
+import sys
+import threading
+import time
+
+_path_param = re.compile(r"{(?:\w+:)?(\w+)}")
+
+
+def sample(schema: dict, rnd: random.Random):
+    # JSON schema(필드 제약조건)를 만족하는 값 생성
+    if "example" in schema:
+        return schema["example"]
+
+    if schema.get("enum"):
+        return rnd.choice(schema["enum"])
+
+    t = schema.get("type")
+
+    if t == "object":
+        required = schema.get("required", [])
+        return {k: sample(v, rnd) for k, v in schema.get("properties", {}).items() if k in required or rnd.random() < 0.5}
+
+    if t == "array":
+        return [sample(schema.get("items", {}), rnd) for _ in range(rnd.randint(1, 3))]
+
+    if t == "integer":
+        lo, hi = _range(schema)
+        lo, hi = math.ceil(lo), math.floor(hi)
+        return rnd.randint(lo, max(lo, hi))
+
+    if t == "number":
+        lo, hi = _range(schema)
+        # 반올림으로 범위를 벗어나지 않도록 clamp
+        return min(max(round(rnd.uniform(lo, hi), 3), lo), hi)
+
+    if t == "boolean":
+        return rnd.choice([True, False])
+
+    if "default" in schema:
+        return schema["default"]
+
+    return _sample_string(schema, rnd)
+
+
+def _range(schema, span=100):
+    # 한쪽 경계만 지정된 경우 지정된 경계로부터 나머지를 결정 (기본 범위는 0 ~ 100)
+    lo = schema.get("minimum")
+    hi = schema.get("maximum")
+
+    if lo is None:
+        lo = 0 if hi is None or hi >= 0 else hi - span
+
+    if hi is None:
+        hi = lo + span
+
+    return lo, hi
+
+
+def _sample_string(schema, rnd):
+    lo = schema.get("minLength", min(1, schema.get("maxLength", 1)))
+    hi = schema.get("maxLength", max(lo, 12))
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+
+    value = ""
+    for _ in range(20):
+        value = "".join(rnd.choice(string.ascii_lowercase + string.digits) for _ in range(rnd.randint(lo, hi)))
+
+        if pattern is None or pattern.match(value):
+            break
+
+    return value
+
+
+def _text(value):
+    if type(value) == bool:
+        return "true" if value else "false"
+
+    if type(value) in [dict, list]:
+        return json.dumps(value)
+
+    return str(value)
+
+
+class Operation:
+    def __init__(self, method, path, spec):
+        self.method = method.upper()
+        self.path = path
+        self.spec = spec
+        self.name = "{0} {1}".format(self.method, path)
+
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+        self.build_errors = 0  # 요청을 생성하지 못한 횟수 (spec의 schema를 sampling할 수 없는 경우)
+        self.build_error = None
+        self._lock = threading.Lock()
+
+    def build(self, rnd: random.Random, token=None):
+        path = self.path
+        query = {}
+        headers = {}
+        body = None
+
+        for param in self.spec.get("parameters", []):
+            if not param.get("required") and rnd.random() < 0.5:
+                continue
+
+            value = _text(sample(param.get("schema", {}), rnd))
+
+            if param["in"] == "path":
+                path = _path_param.sub(lambda m: value if m.group(1) == param["name"] else m.group(0), path)
+            elif param["in"] == "query":
+                query[param["name"]] = value
+            elif param["in"] == "header":
+                headers[param["name"]] = value
+
+        content = self.spec.get("requestBody", {}).get("content", {})
+        if "application/json" in content:
+            body = json.dumps(sample(content["application/json"].get("schema", {}), rnd))
+            headers["Content-Type"] = "application/json"
+        elif "application/x-www-form-urlencoded" in content:
+            data = sample(content["application/x-www-form-urlencoded"].get("schema", {}), rnd)
+            body = urlencode({k: _text(v) for k, v in data.items()})
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        if token and self.spec.get("security"):
+            headers["Authorization"] = "Bearer " + token
+
+        if query:
+            path += "?" + urlencode(query)
+
+        return path, headers, body
+
+    def record(self, elapsed, status):
+        with self._lock:
+            self.latencies.append(elapsed)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+            if status >= 400:
+                self.errors += 1
+
+    def fail(self, e: Exception):
+        with self._lock:
+            self.build_errors += 1
+            self.build_error = "{0}: {1}".format(type(e).__name__, e)
+
+    def report(self, duration):
+        latencies = sorted(self.latencies)
+
+        return {
+            "operation": self.name,
+            "requests": len(latencies),
+            "errors": self.errors,
+            "build_errors": self.build_errors,
+            "build_error": self.build_error,
+            "statuses": self.statuses,
+            "rps": len(latencies) / duration if duration > 0 else 0.0,
+            "p50": _percentile(latencies, 50) * 1000,
+            "p95": _percentile(latencies, 95) * 1000,
+            "p99": _percentile(latencies, 99) * 1000
+        }
+
+
+def _percentile(values, p):
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+
+def _inline(node, schemas):
+    # components/schemas를 참조하는 $ref를 실제 schema로 치환
+    if type(node) == dict:
+        if "$ref" in node:
+            return _inline(schemas[node["$ref"].rsplit("/", 1)[-1]], schemas)
+
+        return {k: _inline(v, schemas) for k, v in node.items()}
+
+    if type(node) == list:
+        return [_inline(v, schemas) for v in node]
+
+    return node
+
+
+def operations(spec: dict, include=None):
+    result = []
+    schemas = spec.get("components", {}).get("schemas", {})
+
+    for path, methods in spec.get("paths", {}).items():
+        for method, oper in methods.items():
+            op = Operation(method, path, _inline(oper, schemas))
+
+            if include is None or re.search(include, op.name):
+                result.append(op)
+
+    return result
+
+
+class InProcessClient:
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, headers, body):
+        return self.client.open(path, method=method, headers=headers, data=body).status_code
+
+
+class HttpClient:
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.prefix = parts.path.rstrip("/")
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+    def request(self, method, path, headers, body):
+        self.connection.request(method, self.prefix + path, body=body, headers=headers)
+        res = self.connection.getresponse()
+        res.read()
+
+        return res.status
+
+
+def run(client_factory, ops, concurrency=4, duration=10.0, requests=None, token=None, seed=None):
+    # duration(초) 동안 또는 전체 requests 개수만큼 concurrency개의 worker로 요청 발생
+    deadline = time.monotonic() + duration
+    counter = {"remaining": requests}
+    lock = threading.Lock()
+
+    def take():
+        if requests is None:
+            return time.monotonic() < deadline
+
+        with lock:
+            if counter["remaining"] <= 0:
+                return False
+
+            counter["remaining"] -= 1
+            return True
+
+    def worker(index):
+        rnd = random.Random(None if seed is None else seed + index)
+        client = client_factory()
+
+        while take():
+            op = rnd.choice(ops)
+
+            try:
+                path, headers, body = op.build(rnd, token)
+            except Exception as e:
+                op.fail(e)
+                continue
+
+            start = time.perf_counter()
+            try:
+                status = client.request(op.method, path, headers, body)
+            except Exception:
+                status = 599
+
+                if isinstance(client, HttpClient):
+                    client = client_factory()
+
+            op.record(time.perf_counter() - start, status)
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    elapsed = time.monotonic() - started
+
+    return {
+        "duration": elapsed,
+        "concurrency": concurrency,
+        "operations": [op.report(elapsed) for op in ops if op.latencies or op.build_errors]
+    }
+
+
+def print_report(result, file=sys.stdout):
+    total = sum(o["requests"] for o in result["operations"])
+
+    print("{0:<50} {1:>8} {2:>7} {3:>9} {4:>9} {5:>9} {6:>9}".format(
+        "operation", "requests", "errors", "rps", "p50 ms", "p95 ms", "p99 ms"), file=file)
+
+    for o in result["operations"]:
+        print("{0:<50} {1:>8} {2:>7} {3:>9.1f} {4:>9.2f} {5:>9.2f} {6:>9.2f}".format(
+            o["operation"][:50], o["requests"], o["errors"], o["rps"], o["p50"], o["p95"], o["p99"]), file=file)
+
+    for o in result["operations"]:
+        if o["build_errors"]:
+            print("{0}: {1} requests could not be built ({2})".format(o["operation"], o["build_errors"], o["build_error"]), file=file)
+
+    print("total {0} requests in {1:.2f}s ({2:.1f} req/s, concurrency {3})".format(
+        total, result["duration"], total / result["duration"] if result["duration"] > 0 else 0.0, result["concurrency"]), file=file)
+
+
+def _load_api(target, config):
+    module, _, attr = target.partition(":")
+    api = getattr(importlib.import_module(module), attr or "api")
+
+    # init_server()가 호출되면 startup이 기록됨 (route가 없는 서비스도 다시 초기화하지 않도록)
+    if api.startup is None:
+        if config:
+            api.init_server(config)
+        else:
+            api.init_server()
+
+    return api
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m flask_restify.loadtest", description="spec-driven load generator")
+    parser.add_argument("target", nargs="?", help="in-process target 'module:attr' resolving to a BaseAPI instance")
+    parser.add_argument("--config", help="config object passed to init_server() for in-process targets")
+    parser.add_argument("--url", help="base url of a running server, e.g. http://localhost:5000")
+    parser.add_argument("--spec", help="swagger.json file or url (default: generated or <url>/api/swagger.json)")
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("-d", "--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("-n", "--requests", type=int, help="total number of requests (overrides duration)")
+    parser.add_argument("-k", dest="include", help="regex on 'METHOD /path' to select operations")
+    parser.add_argument("--token", help="bearer token sent to operations that require authentication")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible requests")
+    parser.add_argument("--json", dest="output", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    if not args.target and not args.url:
+        parser.error("either target or --url is required")
+
+    if args.url:
+        spec_source = args.spec or args.url.rstrip("/") + "/api/swagger.json"
+
+        def factory():
+            return HttpClient(args.url)
+    else:
+        api = _load_api(args.target, args.config)
+        spec_source = args.spec
+
+        def factory():
+            return InProcessClient(api.app)
+
+    if spec_source is None:
+        spec = api.docs.to_json()
+    elif spec_source.startswith("http://"):
+        client = HttpClient(spec_source)
+        client.connection.request("GET", urlsplit(spec_source).path)
+        spec = json.loads(client.connection.getresponse().read())
+    else:
+        with open(spec_source) as f:
+            spec = json.load(f)
+
+    ops = operations(spec, args.include)
+    if not ops:
+        parser.error("no operations found in spec")
+
+    result = run(factory, ops, concurrency=args.concurrency, duration=args.duration,
+                 requests=args.requests, token=args.token, seed=args.seed)
+
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
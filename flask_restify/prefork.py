@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+from werkzeug.serving import make_server
+
+import gc
+import os
+import random
+import signal
+import socket
+import time
+import traceback
+
+
+class PreforkServer:
+    # 부모 프로세스에서 초기화를 모두 마친 뒤 하나의 listening socket을 공유하는 worker 프로세스들을 fork
+    # - 부모: worker 감시 및 재시작 (SIGTERM/SIGINT: graceful 종료, SIGHUP: 모든 worker 순차 재시작)
+    # - worker: 요청 처리, max_requests개 처리 후 또는 SIGTERM 수신시 처리중인 요청을 마치고 종료 (종료시 on_exit 호출)
+
+    def __init__(self, api, host="0.0.0.0", port=5000, workers=None, max_requests=0, max_requests_jitter=0,
+                 graceful_timeout=30, backlog=2048):
+        self.api = api
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+
+        self.logger = api.app.logger
+        self.socket = None
+        self.children = {}  # pid -> (worker index, 시작 시각)
+        self.running = False
+        self.alive = True
+
+        # SIGHUP으로 순차 재시작 중인 worker (재시작 대기 pid 목록, 현재 종료 중인 pid)
+        self.reload_queue = []
+        self.reloading = None
+
+    def listen(self):
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+
+        # 여러 worker가 동시에 깨어나도 accept하지 못한 worker가 block되지 않도록 non-blocking으로 사용
+        sock.setblocking(False)
+        sock.set_inheritable(True)
+
+        return sock
+
+    def warmup(self):
+        # worker마다 반복하지 않도록 spec 직렬화 등 lazy 초기화를 fork 이전에 수행
+        if self.api.swaggerui is not None:
+            self.api.docs.encoded()
+
+        # 초기화 과정의 객체를 GC 추적 대상에서 제외하여 worker에서 copy-on-write가 일어나지 않도록 함
+        gc.collect()
+        gc.freeze()
+
+    def run(self):
+        self.socket = self.listen()
+        self.port = self.socket.getsockname()[1]
+        self.warmup()
+
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGHUP, self.reload)
+
+        self.logger.info("prefork server listening on %s:%d with %d workers", self.host, self.port, self.workers)
+
+        for index in range(self.workers):
+            self.spawn(index)
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            if pid not in self.children:
+                continue
+
+            index, started = self.children.pop(pid)
+
+            if not self.running:
+                continue
+
+            code = os.waitstatus_to_exitcode(status)
+            if code != 0:
+                self.logger.warning("worker %d (pid %d) exited with %d, restarting", index, pid, code)
+
+                # 시작 직후 계속 실패하는 경우 재시작 간격을 둠
+                if time.monotonic() - started < 1.0:
+                    time.sleep(1.0)
+
+            self.spawn(index)
+
+            # 순차 재시작 중이면 새 worker를 띄운 뒤 다음 worker 종료
+            if pid == self.reloading:
+                self.reload_next()
+
+        signal.alarm(0)
+        self.socket.close()
+
+    def spawn(self, index):
+        pid = os.fork()
+
+        if pid:
+            self.children[pid] = (index, time.monotonic())
+            return pid
+
+        code = 0
+        try:
+            self.work(index)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+
+    def stop(self, signum=None, frame=None):
+        if not self.running:
+            # 종료 중에 다시 신호를 받으면 즉시 종료
+            self.kill()
+            return
+
+        self.running = False
+        self.logger.info("stopping workers (graceful timeout %ss)", self.graceful_timeout)
+
+        for pid in list(self.children):
+            _signal(pid, signal.SIGTERM)
+
+        signal.signal(signal.SIGALRM, self.kill)
+        signal.alarm(max(1, int(self.graceful_timeout)))
+
+    def reload(self, signum=None, frame=None):
+        # worker를 하나씩 graceful 종료시키고, 감시 loop에서 새로 fork한 뒤 다음 worker를 종료
+        if self.reloading is not None:
+            self.reload_queue = [pid for pid in self.children if pid != self.reloading]
+            return
+
+        self.reload_queue = list(self.children)
+        self.reload_next()
+
+    def reload_next(self):
+        self.reloading = None
+
+        while self.running and self.reload_queue:
+            pid = self.reload_queue.pop(0)
+
+            if pid in self.children:
+                self.reloading = pid
+                _signal(pid, signal.SIGTERM)
+                return
+
+    def kill(self, signum=None, frame=None):
+        for pid in list(self.children):
+            _signal(pid, signal.SIGKILL)
+
+    def work(self, index):
+        # 터미널의 SIGINT는 부모가 받아 SIGTERM으로 전달하므로 worker에서는 무시
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, self.shutdown)
+
+        self.reset_database()
+
+        limit = self.max_requests
+        if limit and self.max_requests_jitter:
+            limit += random.randint(0, self.max_requests_jitter)
+
+        app = self.api.app
+        served = [0]
+
+        def counted(environ, start_response):
+            served[0] += 1
+            return app(environ, start_response)
+
+        server = make_server(self.host, self.port, counted, fd=self.socket.fileno())
+        server.multiprocess = True
+        server.timeout = 0.5
+
+        while self.alive and not (limit and served[0] >= limit):
+            server.handle_request()
+
+        self.api.on_exit()
+
+    def shutdown(self, signum=None, frame=None):
+        self.alive = False
+
+    def reset_database(self):
+        # 부모에서 열린 DB connection을 worker끼리 공유하지 않도록 pool 초기화
+        if "sqlalchemy" not in self.api.app.extensions:
+            return
+
+        with self.api.app.app_context():
+            for engine in self.api.db.engines.values():
+                engine.dispose(close=False)
+
+
+def _signal(pid, signum):
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
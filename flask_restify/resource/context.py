@@ -4,6 +4,18 @@
 class BaseContext:
     headers = {}
 
+    etag = None
+    last_modified = None
+    conditional = False
+
+    timing = None
+
+    # AuthCache를 지정하면 검증된 token의 인증 상태(session 및 update_authkey에서 설정한 속성)를 재사용
+    auth_cache = None
+    authkey = None
+    session = None
+    auth_state = ()  # update_authkey에서 설정/변경된 속성 이름
+
     def __init__(self, **kwargs):
         self.headers = {}
 
@@ -15,3 +27,48 @@ class BaseContext:
 
     def set_authkey(self, authkey):
         self.headers["X-Authorization-Update"] = "Bearer {0}".format(authkey)
+
+        # token이 갱신되면 캐시 항목도 새 token으로 교체
+        if self.auth_cache is not None and self.authkey:
+            self.auth_cache.revoke(self.authkey)
+
+        self.authkey = authkey
+
+        if self.auth_cache is not None:
+            self.cache_auth()
+
+    def resolve_authkey(self, authkey):
+        if self.auth_cache is None or not authkey:
+            self.authkey = authkey
+            self.update_authkey(authkey)
+            return
+
+        state = self.auth_cache.get(authkey)
+        if state is not None:
+            vars(self).update(state)
+            self.auth_state = tuple(state)
+            return
+
+        before = dict(vars(self))
+
+        self.authkey = authkey
+        self.update_authkey(authkey)
+
+        # 요청마다 새로 구성되는 headers/timing을 제외하고 update_authkey 전후로 달라진 속성만 보관
+        self.auth_state = tuple(k for k, v in vars(self).items()
+                                if k not in ("headers", "timing") and (k not in before or before[k] is not v))
+
+        # update_authkey 중에 set_authkey로 갱신되었다면 새 token 기준으로 보관
+        self.cache_auth()
+
+    def cache_auth(self):
+        if self.session is not None and self.authkey:
+            state = {k: getattr(self, k) for k in self.auth_state}
+            state.update(session=self.session, authkey=self.authkey)
+
+            self.auth_cache.set(self.authkey, state)
+
+    def set_etag(self, etag, last_modified=None):
+        # 응답의 ETag/Last-Modified를 직접 지정 (conditional GET 처리에 사용)
+        self.etag = etag
+        self.last_modified = last_modified
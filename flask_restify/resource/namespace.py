@@ -10,10 +10,22 @@ class Namespace:
 
     routes = {}
 
-    def __init__(self, api, tag, path, description, context):
+    # namespace 전체에 적용되는 동시 처리 제한 (admission control)
+    max_concurrency = None
+    max_queue = 0
+    queue_timeout = None
+    adaptive = False
+
+    def __init__(self, api, tag, path, description, context, max_concurrency=None, max_queue=0, queue_timeout=None,
+                 adaptive=False):
         self.api = api
         self.tag = tag
         self.path = path
         self.description = description
         self.context = context
         self.routes = {}
+
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.adaptive = adaptive
@@ -1,15 +1,27 @@
 # -*- coding: utf-8 -*-
 
-from flask import request
+from flask import request, Response
+from werkzeug.http import is_resource_modified
 from flask_restify.util.error import HttpError
-from flask_restify.util.parser import parse_params
+from flask_restify.util.parser import build_binding, bind_params
+from flask_restify.util.cache import ResponseCache, caches, token_key
+from flask_restify.util.admission import PRIORITIES
+from collections.abc import Iterator
 from functools import wraps
 import inspect
+import weakref
 
+# decorator가 만든 wrapper -> (종류, 설정), init_server에서 wrapper 체인을 하나의 함수로 합칠 때 사용
+_layers = weakref.WeakKeyDictionary()
 
-def route(ns, method="get", path="", description="", tags=[]):
+
+def route(ns, method="get", path="", description="", tags=[], max_concurrency=None, max_queue=0, queue_timeout=None,
+          priority="normal", adaptive=False):
     method = method.lower()
 
+    if priority not in PRIORITIES:
+        raise ValueError("unknown priority '{0}' (one of {1})".format(priority, ", ".join(PRIORITIES)))
+
     def decorator(f):
         title = f.__module__+"."+f.__qualname__
 
@@ -38,6 +50,15 @@ def route(ns, method="get", path="", description="", tags=[]):
         if description and len(description) > 0:
             data["description"] = description
 
+        # 동시 처리 제한 및 우선순위, init_server에서 Limiter로 구성
+        data["admission"] = {
+            "max_concurrency": max_concurrency,
+            "max_queue": max_queue,
+            "queue_timeout": queue_timeout,
+            "priority": priority,
+            "adaptive": adaptive
+        }
+
         # 해당 method에 내용 등록
         target[method] = data
 
@@ -64,34 +85,47 @@ def parameter(path=None, header=None, body=None, query=None, form=None):
 
                     f.params[name] = {"in": place, "data": d}
 
-        @wraps(f)
-        def wrapped_f(*args, **kwargs):
-            req = []
-            if path:
-                req.append((path, kwargs))
+        # 등록시점에 파라미터 바인딩 계획을 미리 구성
+        plan = build_binding([("path", path), ("header", header), ("body", body), ("query", query), ("form", form)],
+                             inspect.signature(f).parameters)
+
+        def bind(kwargs):
+            sources = {"path": kwargs}
 
             if header:
-                req.append((header, request.headers))
+                sources["header"] = request.headers
 
             if body:
-                req.append((body, request.get_json()))
+                data = request.get_json(silent=True)
+                sources["body"] = data if isinstance(data, dict) else {}
 
             if query:
-                req.append((query, {k: v for k, v in request.args.items()}))
+                sources["query"] = request.args
 
             if form:
-                req.append((form, request.form))
+                sources["form"] = request.form
+
+            return bind_params(plan, sources, kwargs)
 
-            # 파싱할 내용이 있을때만
-            blueprints = {}
-            params = {x: None for x in inspect.signature(f).parameters}
-            for target, source in req:
-                blueprints.update(target)
-                params.update(source)
+        def bind_timed(context, kwargs):
+            result = bind(kwargs)
 
-            result = parse_params(blueprints, params, kwargs)
+            timing = getattr(context, "timing", None)
+            if timing:
+                timing.mark("params")
 
-            return f(*args, **result)
+            return result
+
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def wrapped_f(*args, **kwargs):
+                return await f(*args, **bind_timed(args[0], kwargs))
+        else:
+            @wraps(f)
+            def wrapped_f(*args, **kwargs):
+                return f(*args, **bind_timed(args[0], kwargs))
+
+        _layers[wrapped_f] = ("params", bind_timed)
 
         return wrapped_f
 
@@ -112,9 +146,120 @@ def response(code=200, description="", model=None):
 
         f.responses[code] = {"description": description, "model": model}
 
-        @wraps(f)
-        def wrapped_f(*args, **kwargs):
-            return f(*args, **kwargs)
+        # 문서화 정보만 등록하므로 wrapper 없이 그대로 반환
+        return f
+
+    return decorator
+
+
+def cache(ttl=None, vary=None, maxsize=128, identity=None):
+    if vary is None:
+        vary = []
+
+    def decorator(f):
+        # parameter() 보다 아래에 있어야 검증된 파라미터로 key를 구성할 수 있음
+        if getattr(f, "params", None):
+            raise Exception("cache() must be declared below parameter().")
+
+        title = f.__module__+"."+f.__qualname__
+        store = ResponseCache(ttl=ttl, maxsize=maxsize)
+        caches[title] = store
+
+        # authenticate()가 아래에 있으면 cache hit시 인증 검사를 거치지 않으므로 identity가 없으면 인증 token의 hash를 key에 포함
+        # (token이 없는 요청은 인증된 응답과 key가 달라 항상 miss -> authenticate()에서 401)
+        per_token = getattr(f, "auth", False) and identity is None
+
+        def make_key(context, kwargs):
+            key = title + "?" + "".join("{0}={1!r}&".format(k, kwargs[k]) for k in sorted(kwargs))
+
+            for name in vary:
+                key += "h:{0}={1!r}&".format(name, request.headers.get(name))
+
+            if identity:
+                key += "id={0!r}&".format(identity(context))
+
+            if per_token:
+                key += "t={0}&".format(token_key(request.headers.get("Authorization", "")))
+
+            return key
+
+        def cacheable(result):
+            value = result[0] if type(result) == tuple else result
+            return not isinstance(value, (Response, Iterator))
+
+        miss = object()
+
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def wrapped_f(*args, **kwargs):
+                key = make_key(args[0], kwargs)
+                result = store.get(key, miss)
+
+                if result is miss:
+                    result = await f(*args, **kwargs)
+
+                    if cacheable(result):
+                        store.set(key, result)
+
+                return result
+        else:
+            @wraps(f)
+            def wrapped_f(*args, **kwargs):
+                key = make_key(args[0], kwargs)
+                result = store.get(key, miss)
+
+                if result is miss:
+                    result = f(*args, **kwargs)
+
+                    if cacheable(result):
+                        store.set(key, result)
+
+                return result
+
+        wrapped_f.cache = store
+        wrapped_f.cache_policy = {"ttl": ttl, "maxsize": maxsize, "vary": list(vary)}
+
+        if identity:
+            wrapped_f.cache_policy["identity"] = True
+
+        return wrapped_f
+
+    return decorator
+
+
+def etag(version=None, last_modified=None):
+    def decorator(f):
+        # version/last_modified 함수는 핸들러와 같은 인자를 받아 핸들러 실행 전에 호출됨
+        def precondition(args, kwargs):
+            context = args[0]
+            context.conditional = True
+
+            if version is None and last_modified is None:
+                return None
+
+            tag = version(*args, **kwargs) if version else None
+            modified = last_modified(*args, **kwargs) if last_modified else None
+            context.set_etag(tag, modified)
+
+            if request.method in ["GET", "HEAD"] and not is_resource_modified(request.environ, etag=tag, last_modified=modified):
+                response = Response(status=304)
+                if tag:
+                    response.set_etag(tag)
+                if modified:
+                    response.last_modified = modified
+
+                return response
+
+            return None
+
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def wrapped_f(*args, **kwargs):
+                return precondition(args, kwargs) or await f(*args, **kwargs)
+        else:
+            @wraps(f)
+            def wrapped_f(*args, **kwargs):
+                return precondition(args, kwargs) or f(*args, **kwargs)
 
         return wrapped_f
 
@@ -132,12 +277,22 @@ def error(code, description="", exception: type(BaseException) = BaseException):
         else:
             f.responses[code] = {"description": description, "model": None}
 
-        @wraps(f)
-        def wrapped_f(*args, **kwargs):
-            try:
-                return f(*args, **kwargs)
-            except exception as e:
-                raise HttpError(code, description, str(e))
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def wrapped_f(*args, **kwargs):
+                try:
+                    return await f(*args, **kwargs)
+                except exception as e:
+                    raise HttpError(code, description, str(e))
+        else:
+            @wraps(f)
+            def wrapped_f(*args, **kwargs):
+                try:
+                    return f(*args, **kwargs)
+                except exception as e:
+                    raise HttpError(code, description, str(e))
+
+        _layers[wrapped_f] = ("error", (exception, code, description))
 
         return wrapped_f
 
@@ -157,13 +312,102 @@ def authenticate(optional=False):
 
         f.responses[401] = {"description": "인증되지 않음", "model": None}
 
-        @wraps(f)
-        def wrapped_f(*args, **kwargs):
-            if args[0].session is None and not optional:
-                raise HttpError(401, "인증이 필요합니다.")
+        if inspect.iscoroutinefunction(f):
+            @wraps(f)
+            async def wrapped_f(*args, **kwargs):
+                if args[0].session is None and not optional:
+                    raise HttpError(401, "인증이 필요합니다.")
+
+                return await f(*args, **kwargs)
+        else:
+            @wraps(f)
+            def wrapped_f(*args, **kwargs):
+                if args[0].session is None and not optional:
+                    raise HttpError(401, "인증이 필요합니다.")
+
+                return f(*args, **kwargs)
 
-            return f(*args, **kwargs)
+        _layers[wrapped_f] = ("auth", optional)
 
         return wrapped_f
 
     return decorator
+
+
+def compile_handler(f):
+    # parameter / error / authenticate wrapper 체인을 하나의 함수로 합쳐서 반환
+    # 등록되지 않은 wrapper(cache, etag, 사용자 decorator)를 만나면 그 wrapper부터는 그대로 호출
+    steps = []
+    errors = []
+
+    while f in _layers:
+        kind, data = _layers[f]
+
+        if kind == "params":
+            steps.append((len(steps) + len(errors), data))
+        elif kind == "auth" and not data:
+            steps.append((len(steps) + len(errors), _require_session))
+        elif kind == "error":
+            errors.append((len(steps) + len(errors), data))
+
+        f = f.__wrapped__
+
+    target = f
+    depth = len(steps) + len(errors)
+
+    if not steps and not errors:
+        return target
+
+    def remap(e, stage):
+        # 중첩된 error() wrapper와 동일하게, 예외가 발생한 단계보다 바깥쪽 error()만 안쪽부터 순서대로 적용
+        for i, (exception, code, description) in reversed(errors):
+            if i < stage and isinstance(e, exception):
+                e = HttpError(code, description, str(e))
+
+        return e
+
+    if inspect.iscoroutinefunction(target):
+        async def handler(context, *args, **kwargs):
+            stage = 0
+            try:
+                for stage, step in steps:
+                    kwargs = step(context, kwargs)
+
+                stage = depth
+                return await target(context, *args, **kwargs)
+            except BaseException as e:
+                if not errors:
+                    raise
+
+                mapped = remap(e, stage)
+                if mapped is e:
+                    raise
+
+                raise mapped
+    else:
+        def handler(context, *args, **kwargs):
+            stage = 0
+            try:
+                for stage, step in steps:
+                    kwargs = step(context, kwargs)
+
+                stage = depth
+                return target(context, *args, **kwargs)
+            except BaseException as e:
+                if not errors:
+                    raise
+
+                mapped = remap(e, stage)
+                if mapped is e:
+                    raise
+
+                raise mapped
+
+    return wraps(target)(handler)
+
+
+def _require_session(context, kwargs):
+    if context.session is None:
+        raise HttpError(401, "인증이 필요합니다.")
+
+    return kwargs
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# 서비스 기동 시간 분석 (import 시간 + init_server 단계별 시간)
+#
+#   python -m flask_restify.startup myservice.app:api --config app.config.ProductionConfig
+
+import argparse
+import importlib
+import json
+import re
+import subprocess
+import sys
+import time
+
+_importtime = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_times(module):
+    # 새 인터프리터에서 -X importtime으로 module을 import하여 최상위 package별 import 시간(self time 합계) 집계
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                          stderr=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True)
+
+    packages = {}
+    total = 0
+
+    for line in proc.stderr.splitlines():
+        m = _importtime.match(line)
+        if m is None:
+            continue
+
+        own, cumulative, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + own
+
+        if len(indent) == 1:
+            total += cumulative
+
+    return {
+        "total": round(total / 1000, 3),
+        "packages": {k: round(v / 1000, 3) for k, v in sorted(packages.items(), key=lambda x: -x[1])}
+    }
+
+
+def measure(target, config=None):
+    module, _, attr = target.partition(":")
+
+    result = {"imports": import_times(module)}
+
+    started = time.perf_counter()
+    api = getattr(importlib.import_module(module), attr or "api")
+    result["import"] = round((time.perf_counter() - started) * 1000, 3)
+
+    if api.startup is None:
+        if config:
+            api.init_server(config)
+        else:
+            api.init_server()
+
+    result["init_server"] = api.startup or {}
+
+    return result
+
+
+def print_report(result, top=15, file=sys.stdout):
+    print("import {0:.1f} ms (in-process), {1:.1f} ms (fresh interpreter)".format(
+        result["import"], result["imports"]["total"]), file=file)
+
+    for name, ms in list(result["imports"]["packages"].items())[:top]:
+        print("  {0:<40} {1:>9.1f} ms".format(name, ms), file=file)
+
+    print("init_server {0:.1f} ms".format(result["init_server"].get("total", 0.0)), file=file)
+
+    for name, ms in result["init_server"].items():
+        if name != "total":
+            print("  {0:<40} {1:>9.1f} ms".format(name, ms), file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m flask_restify.startup", description="startup time breakdown")
+    parser.add_argument("target", help="'module:attr' resolving to a BaseAPI instance")
+    parser.add_argument("--config", help="config object passed to init_server()")
+    parser.add_argument("--top", type=int, default=15, help="number of packages to show")
+    parser.add_argument("--json", dest="output", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    result = measure(args.target, args.config)
+
+    print_report(result, args.top)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
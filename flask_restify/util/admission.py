@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+from flask_restify.util.error import HttpError
+
+import heapq
+import itertools
+import math
+import threading
+
+# 우선순위 (작을수록 먼저 처리), critical은 서버 전체/namespace 제한을 받지 않음
+PRIORITIES = {
+    "critical": 0,
+    "high": 1,
+    "normal": 2,
+    "low": 3
+}
+
+
+class Limiter:
+    # 동시 처리 개수 제한 + 대기열
+    # - 대기열이 가득 차면 더 낮은 우선순위의 대기 요청을 밀어내거나 즉시 거절
+    # - adaptive: 처리시간이 기준(관측된 최소 처리시간 * tolerance 또는 target_latency)을 넘으면 limit을 줄이고,
+    #   기준 이하로 limit만큼 처리되면 1씩 늘림 (AIMD)
+
+    def __init__(self, name, limit, queue=0, timeout=1.0, status=503,
+                 adaptive=False, min_limit=1, max_limit=None, target_latency=None, tolerance=2.0):
+        self.name = name
+        self.limit = limit
+        self.queue = queue
+        self.timeout = timeout
+        self.status = status
+
+        self.adaptive = adaptive
+        self.min_limit = min_limit
+        self.max_limit = max_limit or limit * 4
+        self.target_latency = target_latency
+        self.tolerance = tolerance
+        self.best = None
+
+        self.active = 0
+        self.admitted = 0
+        self.rejected = 0
+
+        self._waiters = []
+        self._queued = 0
+        self._successes = 0
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def acquire(self, priority=PRIORITIES["normal"], wait=True):
+        waiter = self._enter(priority, wait, threading.Event())
+        if waiter is None:
+            return
+
+        waiter[2].wait(self.timeout)
+        self._settle(waiter)
+
+    async def acquire_async(self, priority=PRIORITIES["normal"]):
+        # 이벤트 루프를 막지 않도록 future로 대기 (release는 다른 thread에서 호출될 수 있음)
+        # asyncio는 ASGI에서만 필요하므로 WSGI 서비스의 import 비용이 늘지 않도록 사용 시점에 import
+        import asyncio
+
+        event = _AsyncEvent()
+        waiter = self._enter(priority, True, event)
+        if waiter is None:
+            return
+
+        try:
+            await asyncio.wait([event.future], timeout=self.timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        self._settle(waiter)
+
+    def _enter(self, priority, wait, event):
+        # 바로 획득하면 None, 대기해야 하면 대기열에 추가한 waiter 반환
+        with self._lock:
+            if self.active < self.limit and not self._queued:
+                self.active += 1
+                self.admitted += 1
+                return None
+
+            if not wait or self.queue <= 0 or not self._make_room(priority):
+                raise self._reject()
+
+            # [priority, seq, event, 상태(None: 대기, True: 허가, False: 밀려남)]
+            waiter = [priority, next(self._seq), event, None]
+            heapq.heappush(self._waiters, waiter)
+            self._queued += 1
+
+            return waiter
+
+    def _settle(self, waiter):
+        with self._lock:
+            if waiter[3] is True:
+                self.admitted += 1
+                return
+
+            if waiter[3] is None:
+                # 시간 초과, release에서 건너뛰도록 표시
+                waiter[3] = False
+                self._queued -= 1
+
+            raise self._reject()
+
+    def _abandon(self, waiter):
+        # 대기 중 취소된 요청, 이미 slot을 넘겨받았다면 반환
+        with self._lock:
+            granted = waiter[3] is True
+
+            if waiter[3] is None:
+                waiter[3] = False
+                self._queued -= 1
+
+        if granted:
+            self.release()
+
+    def release(self, latency=None):
+        with self._lock:
+            if self.adaptive and latency is not None:
+                self._adapt(latency)
+
+            self.active -= 1
+
+            # 빈 slot을 우선순위가 높은 대기 요청부터 넘겨줌 (limit이 줄어든 경우 넘겨주지 않음)
+            while self._waiters and self.active < self.limit:
+                waiter = heapq.heappop(self._waiters)
+                if waiter[3] is not None:
+                    continue
+
+                waiter[3] = True
+                self._queued -= 1
+                self.active += 1
+                waiter[2].set()
+
+    def _make_room(self, priority):
+        if self._queued < self.queue:
+            return True
+
+        # 대기열이 가득 찬 경우 가장 낮은 우선순위(같으면 가장 늦게 들어온) 대기 요청을 밀어냄
+        victim = max((w for w in self._waiters if w[3] is None), key=lambda w: (w[0], w[1]), default=None)
+        if victim is None or victim[0] <= priority:
+            return False
+
+        victim[3] = False
+        self._queued -= 1
+        victim[2].set()
+
+        return True
+
+    def _adapt(self, latency):
+        if self.best is None or latency < self.best:
+            self.best = latency
+        else:
+            # 부하 패턴이 바뀌어도 기준이 따라갈 수 있도록 최소값을 천천히 증가
+            self.best += (latency - self.best) * 0.01
+
+        target = self.target_latency or self.best * self.tolerance
+
+        if latency > target:
+            self.limit = max(self.min_limit, int(self.limit * 0.9))
+            self._successes = 0
+        else:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self.limit = min(self.max_limit, self.limit + 1)
+                self._successes = 0
+
+    def _reject(self):
+        self.rejected += 1
+
+        retry = max(1, math.ceil(self.timeout or 1))
+        return HttpError(self.status, "too many requests" if self.status == 429 else "service overloaded",
+                         "'{0}' is over its concurrency limit".format(self.name), headers={"Retry-After": str(retry)})
+
+    def stats(self):
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": self._queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected
+        }
+
+
+class _AsyncEvent:
+    # threading.Event와 같은 set()으로 asyncio future를 완료
+    def __init__(self):
+        import asyncio
+
+        self.loop = asyncio.get_running_loop()
+        self.future = self.loop.create_future()
+
+    def set(self):
+        self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+def acquire(limiters, priority, wait=True):
+    # 모든 limiter를 순서대로 획득, 실패하면 이미 획득한 limiter를 반환하고 예외 발생
+    acquired = []
+
+    try:
+        for limiter in limiters:
+            limiter.acquire(priority, wait)
+            acquired.append(limiter)
+    except HttpError:
+        for limiter in reversed(acquired):
+            limiter.release()
+
+        raise
+
+    return acquired
+
+
+async def acquire_async(limiters, priority):
+    acquired = []
+
+    try:
+        for limiter in limiters:
+            await limiter.acquire_async(priority)
+            acquired.append(limiter)
+    except BaseException:
+        # 거절 또는 대기 중 요청이 취소된 경우
+        for limiter in reversed(acquired):
+            limiter.release()
+
+        raise
+
+    return acquired
+
+
+def release(limiters, latency=None):
+    for limiter in reversed(limiters):
+        limiter.release(latency)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+import base64
+import hashlib
+import json
+import threading
+import time
+
+
+class ResponseCache:
+    # LRU + TTL 기반의 핸들러 결과 캐시
+    ttl = None
+    maxsize = 128
+
+    def __init__(self, ttl=None, maxsize=128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires, value = entry
+
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+
+        expires = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def invalidate(self, prefix=""):
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+
+            for k in keys:
+                del self._entries[k]
+
+        return len(keys)
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+class AuthCache(ResponseCache):
+    # 검증된 인증 token -> 인증 상태({"session": ..., 속성: 값}) 캐시 (BaseContext.auth_cache로 지정하여 사용)
+    # token 원문 대신 hash를 key로 보관하며, JWT의 exp claim이 있으면 만료시각을 따름
+
+    def __init__(self, ttl=300, maxsize=10000):
+        super().__init__(ttl=ttl, maxsize=maxsize)
+
+    def get(self, token, default=None):
+        return super().get(token_key(token), default)
+
+    def set(self, token, value, ttl=None):
+        expires = token_expiry(token)
+
+        if expires is not None:
+            remain = expires - time.time()
+            if remain <= 0:
+                return
+
+            ttl = min(remain, ttl or self.ttl or remain)
+
+        super().set(token_key(token), value, ttl)
+
+    def revoke(self, token):
+        return self.delete(token_key(token))
+
+    def revoke_if(self, predicate):
+        # predicate(session)이 True인 항목을 모두 폐기 (예: 특정 사용자의 모든 token)
+        with self._lock:
+            keys = [k for k, (expires, value) in self._entries.items() if predicate(value["session"])]
+
+            for k in keys:
+                del self._entries[k]
+
+        return len(keys)
+
+    def clear(self):
+        return self.invalidate()
+
+
+def token_key(token):
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def token_expiry(token):
+    # JWT payload의 exp(epoch seconds) 반환, JWT가 아니거나 exp가 없으면 None
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+    except ValueError:
+        return None
+
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+
+    return exp if isinstance(exp, (int, float)) else None
+
+
+# route title -> ResponseCache
+caches: {str: ResponseCache} = {}
+
+
+def invalidate(prefix=""):
+    # key는 "<route title>?<param>=<value>&..." 형식이므로 prefix로 endpoint/파라미터 단위 무효화 가능
+    return sum(c.invalidate(prefix) for c in caches.values())
+
+
+def stats():
+    return {title: c.stats() for title, c in caches.items()}
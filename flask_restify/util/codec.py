@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import json
+import datetime
+import decimal
+import enum
+import uuid
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json만 사용
+    orjson = None
+
+
+def _default(o):
+    # json 기본 타입이 아닌 값 변환 (orjson의 native 출력과 동일한 형태)
+    if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+        return o.isoformat()
+
+    if isinstance(o, enum.Enum):
+        return o.value
+
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+
+    raise TypeError("Object of type '{0}' is not JSON serializable".format(type(o).__name__))
+
+
+def _json_dumps(obj) -> bytes:
+    # orjson과 같은 출력이 되도록 NaN/Infinity는 null, 지수 표기는 orjson 형식(1e16, 1e-7)으로 맞춤
+    # C encoder의 결과에 지수 표기가 없으면 그대로 사용하고, 있거나 NaN/Infinity가 있으면 float 형식을 지정하여 다시 직렬화
+    try:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default, allow_nan=False)
+    except ValueError:
+        text = None
+
+    # repr()과 orjson의 표기가 다른 지수는 e+NN(양수)과 e-0N(-1 ~ -9)뿐
+    if text is None or "e+" in text or "e-0" in text:
+        encode = json.encoder._make_iterencode({}, _default, json.encoder.encode_basestring, None, _float_text,
+                                               ":", ",", False, False, True)
+        text = "".join(encode(obj, 0))
+
+    return text.encode("utf-8")
+
+
+def _float_text(value: float) -> str:
+    if value != value or value in (float("inf"), float("-inf")):
+        return "null"
+
+    text = float.__repr__(value)
+    if "e" not in text:
+        return text
+
+    mantissa, exponent = text.split("e")
+    exponent = int(exponent)
+
+    # orjson은 1e-5 ~ 1e-4 구간을 소수로 표기
+    if exponent == -5:
+        sign = "-" if mantissa.startswith("-") else ""
+        return sign + "0.0000" + mantissa.lstrip("-").replace(".", "")
+
+    return "{0}e{1}".format(mantissa, exponent)
+
+
+def _orjson_dumps(obj) -> bytes:
+    try:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # 64bit 범위를 넘는 정수 등 orjson이 처리하지 못하는 값
+        return _json_dumps(obj)
+
+
+_backends = {
+    "json": (_json_dumps, json.loads)
+}
+
+if orjson is not None:
+    _backends["orjson"] = (_orjson_dumps, orjson.loads)
+
+backend = None
+_dumps, _loads = _backends["json"]
+
+
+def set_backend(name: str = "auto"):
+    global backend, _dumps, _loads
+
+    if name == "auto":
+        name = "orjson" if "orjson" in _backends else "json"
+
+    if name not in _backends:
+        raise ValueError("json backend '{0}' is not available.".format(name))
+
+    backend = name
+    _dumps, _loads = _backends[name]
+
+
+def dumps(obj) -> bytes:
+    return _dumps(obj)
+
+
+def loads(data):
+    return _loads(data)
+
+
+set_backend()
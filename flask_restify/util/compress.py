@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import zlib
+
+_wbits = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS
+}
+
+
+class Compressor:
+    level = 6
+    min_size = 500
+    mimetypes = ["application/json", "application/x-ndjson", "text/plain", "text/html"]
+
+    def __init__(self, level=6, min_size=500, mimetypes=None):
+        self.level = level
+        self.min_size = min_size
+
+        if mimetypes is not None:
+            self.mimetypes = mimetypes
+
+        # 압축 전/후 byte 수 (절감량 확인용)
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+
+    def compress(self, request, response):
+        if response.status_code < 200 or response.status_code in [204, 304]:
+            return response
+
+        # 이미 인코딩된 응답 또는 파일 전송은 건너뜀
+        if "Content-Encoding" in response.headers or response.direct_passthrough:
+            return response
+
+        if response.mimetype not in self.mimetypes:
+            return response
+
+        encoding = request.accept_encodings.best_match(list(_wbits))
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = self._stream(response.response, encoding)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, _wbits[encoding])
+            compressed = compressor.compress(data) + compressor.flush()
+
+            self.raw_bytes += len(data)
+            self.compressed_bytes += len(compressed)
+
+            response.set_data(compressed)
+
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+
+        # 표현이 바뀌므로 strong ETag는 weak로 변경
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
+
+    def _stream(self, iterable, encoding):
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, _wbits[encoding])
+
+        try:
+            for chunk in iterable:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+
+                # 청크 단위로 바로 전달되도록 sync flush
+                compressed = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+                self.raw_bytes += len(chunk)
+                self.compressed_bytes += len(compressed)
+
+                if compressed:
+                    yield compressed
+
+            compressed = compressor.flush()
+            self.compressed_bytes += len(compressed)
+
+            yield compressed
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    def stats(self):
+        return {
+            "raw_bytes": self.raw_bytes,
+            "compressed_bytes": self.compressed_bytes
+        }
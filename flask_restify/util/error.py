@@ -5,11 +5,13 @@ class HttpError(BaseException):
     code: int
     message: str
     description: str
+    headers: dict
 
-    def __init__(self, code: int, message: str, description: str = None):
+    def __init__(self, code: int, message: str, description: str = None, headers: dict = None):
         self.code = code
         self.message = message
         self.description = description
+        self.headers = headers
 
     def to_dict(self):
         return {
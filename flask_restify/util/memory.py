@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import tracemalloc
+
+# tracemalloc 자체 및 추적 코드의 할당은 제외
+_filters = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__)
+]
+
+
+class MemoryTracker:
+    # tracemalloc 기반 endpoint별 메모리 사용량 추적
+    # tracemalloc은 프로세스 전역이므로 동시에 처리중인 요청의 할당도 함께 집계될 수 있음
+
+    def __init__(self, budget=None, top=10, frames=1, logger=None):
+        self.budget = budget
+        self.top = top
+        self.logger = logger
+
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def run(self, endpoint, f, *args, **kwargs):
+        snapshot, before = self._begin()
+
+        result = f(*args, **kwargs)
+
+        self._end(endpoint, snapshot, before)
+
+        return result
+
+    async def run_async(self, endpoint, f, *args, **kwargs):
+        snapshot, before = self._begin()
+
+        result = await f(*args, **kwargs)
+
+        self._end(endpoint, snapshot, before)
+
+        return result
+
+    def _begin(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces(_filters)
+
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+
+        return snapshot, before
+
+    def _end(self, endpoint, snapshot, before):
+        # 핸들러가 반환한 결과가 살아있는 시점에 비교하여 할당 위치 파악
+        _, peak = tracemalloc.get_traced_memory()
+        sites = tracemalloc.take_snapshot().filter_traces(_filters).compare_to(snapshot, "lineno")
+
+        self.record(endpoint, peak - before, sites)
+
+    def record(self, endpoint, peak, sites):
+        top = [{
+            "site": str(stat.traceback),
+            "size": stat.size_diff,
+            "count": stat.count_diff
+        } for stat in sites[:self.top] if stat.size_diff > 0]
+
+        with self._lock:
+            data = self.endpoints.get(endpoint)
+            if data is None:
+                data = self.endpoints[endpoint] = {"requests": 0, "peak_max": 0, "peak_sum": 0, "peak_last": 0, "top": []}
+
+            data["requests"] += 1
+            data["peak_sum"] += peak
+            data["peak_last"] = peak
+
+            # 최대 peak를 기록한 요청의 할당 위치를 보관
+            if peak >= data["peak_max"]:
+                data["peak_max"] = peak
+                data["top"] = top
+
+        if self.budget and peak > self.budget and self.logger:
+            self.logger.warning("memory budget exceeded: endpoint=%s peak=%d budget=%d top=%s",
+                                endpoint, peak, self.budget, top[:3])
+
+    def stats(self):
+        with self._lock:
+            return {k: dict(v) for k, v in self.endpoints.items()}
+
+    def render(self):
+        lines = [
+            "# HELP restify_memory_peak_bytes Largest per-request allocation peak by endpoint.",
+            "# TYPE restify_memory_peak_bytes gauge"
+        ]
+
+        stats = self.stats()
+        for endpoint, data in stats.items():
+            lines.append('restify_memory_peak_bytes{{endpoint="{0}"}} {1}'.format(endpoint, data["peak_max"]))
+
+        lines.append("# HELP restify_memory_allocated_bytes Sum of per-request allocation peaks by endpoint.")
+        lines.append("# TYPE restify_memory_allocated_bytes summary")
+        for endpoint, data in stats.items():
+            lines.append('restify_memory_allocated_bytes_sum{{endpoint="{0}"}} {1}'.format(endpoint, data["peak_sum"]))
+            lines.append('restify_memory_allocated_bytes_count{{endpoint="{0}"}} {1}'.format(endpoint, data["requests"]))
+
+        return "\n".join(lines) + "\n"
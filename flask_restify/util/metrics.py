@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+import json
+import os
+import threading
+import time
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointStats:
+    __slots__ = ("counts", "buckets", "latency_sum", "size_sum", "in_flight")
+
+    def __init__(self, size):
+        self.counts = {}
+        self.buckets = [0] * (size + 1)  # 마지막 칸은 +Inf
+        self.latency_sum = 0.0
+        self.size_sum = 0
+        self.in_flight = 0
+
+    def snapshot(self):
+        # 요청 thread가 새 status를 추가하는 중일 수 있으므로 복사 후 변환 (dict 복사는 GIL 아래에서 원자적)
+        return {
+            "counts": {str(k): v for k, v in self.counts.copy().items()},
+            "buckets": list(self.buckets),
+            "latency_sum": self.latency_sum,
+            "size_sum": self.size_sum,
+            "in_flight": self.in_flight
+        }
+
+
+class Metrics:
+    # 요청마다 lock을 잡지 않도록 thread별 shard에 기록하고, 조회 시점에 합산
+    # directory를 지정하면 pre-fork된 worker들의 값을 파일로 공유하여 합산
+
+    buckets = BUCKETS
+    directory = None
+    interval = 1.0
+
+    def __init__(self, buckets=BUCKETS, directory=None, interval=1.0):
+        self.buckets = tuple(buckets)
+        self.directory = directory
+        self.interval = interval
+
+        self._local = threading.local()
+        self._shards = []  # (thread, shard)
+        self._retired = {}  # 종료된 thread의 shard를 합산한 값
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flushed = 0.0
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            thread = threading.current_thread()
+
+            # 요청마다 thread를 생성하는 서버에서도 shard가 쌓이지 않도록 새 shard를 만들 때 종료된 thread의 shard를 정리
+            with self._lock:
+                self._retire()
+                self._shards.append((thread, shard))
+
+            return shard
+
+    def _retire(self):
+        alive = []
+
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+                continue
+
+            for title, stats in shard.items():
+                _merge(self._retired, title, stats.snapshot())
+
+        self._shards = alive
+
+    def begin(self, title):
+        shard = self._shard()
+
+        stats = shard.get(title)
+        if stats is None:
+            stats = shard[title] = EndpointStats(len(self.buckets))
+
+        stats.in_flight += 1
+
+        return stats
+
+    def end(self, stats, elapsed, status, size):
+        stats.in_flight -= 1
+        stats.counts[status] = stats.counts.get(status, 0) + 1
+        stats.buckets[bisect_left(self.buckets, elapsed)] += 1
+        stats.latency_sum += elapsed
+        stats.size_sum += size
+
+        if self.directory and time.monotonic() - self._flushed > self.interval:
+            self.flush()
+
+    def snapshot(self):
+        result = {}
+
+        with self._lock:
+            self._retire()
+            shards = [shard for thread, shard in self._shards]
+
+            for title, stats in self._retired.items():
+                _merge(result, title, stats)
+
+        for shard in shards:
+            for title, stats in list(shard.items()):
+                _merge(result, title, stats.snapshot())
+
+        return result
+
+    def flush(self):
+        # 동시에 여러 thread가 flush하지 않도록 non-blocking으로 시도
+        if not self._flush_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._flushed = time.monotonic()
+
+            path = os.path.join(self.directory, "{0}.json".format(os.getpid()))
+            tmp = path + ".tmp"
+
+            with open(tmp, "w") as f:
+                json.dump(self.snapshot(), f)
+
+            os.replace(tmp, path)
+        finally:
+            self._flush_lock.release()
+
+    def collect(self):
+        result = self.snapshot()
+
+        if not self.directory:
+            return result
+
+        own = "{0}.json".format(os.getpid())
+
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json") or name == own:
+                continue
+
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+            # 종료된 worker의 누적값은 유지하고 in-flight gauge만 제외
+            alive = _is_alive(int(name[:-5])) if name[:-5].isdigit() else False
+
+            for title, stats in data.items():
+                if not alive:
+                    stats["in_flight"] = 0
+
+                _merge(result, title, stats)
+
+        return result
+
+    def render(self, extra=None):
+        data = self.collect()
+        lines = []
+
+        lines.append("# HELP restify_requests_total Total number of requests by endpoint and status.")
+        lines.append("# TYPE restify_requests_total counter")
+        for title, stats in data.items():
+            for status, count in sorted(stats["counts"].items()):
+                lines.append('restify_requests_total{{endpoint="{0}",status="{1}"}} {2}'.format(_label(title), status, count))
+
+        lines.append("# HELP restify_request_duration_seconds Request latency by endpoint.")
+        lines.append("# TYPE restify_request_duration_seconds histogram")
+        for title, stats in data.items():
+            label = _label(title)
+            cumulative = 0
+            for le, count in zip(list(self.buckets) + ["+Inf"], stats["buckets"]):
+                cumulative += count
+                lines.append('restify_request_duration_seconds_bucket{{endpoint="{0}",le="{1}"}} {2}'.format(label, le, cumulative))
+
+            lines.append('restify_request_duration_seconds_sum{{endpoint="{0}"}} {1}'.format(label, stats["latency_sum"]))
+            lines.append('restify_request_duration_seconds_count{{endpoint="{0}"}} {1}'.format(label, cumulative))
+
+        lines.append("# HELP restify_requests_in_flight Requests currently being handled by endpoint.")
+        lines.append("# TYPE restify_requests_in_flight gauge")
+        for title, stats in data.items():
+            lines.append('restify_requests_in_flight{{endpoint="{0}"}} {1}'.format(_label(title), stats["in_flight"]))
+
+        lines.append("# HELP restify_response_size_bytes Response body size by endpoint.")
+        lines.append("# TYPE restify_response_size_bytes summary")
+        for title, stats in data.items():
+            label = _label(title)
+            lines.append('restify_response_size_bytes_sum{{endpoint="{0}"}} {1}'.format(label, stats["size_sum"]))
+            lines.append('restify_response_size_bytes_count{{endpoint="{0}"}} {1}'.format(label, sum(stats["buckets"])))
+
+        for name, (kind, help, value) in (extra or {}).items():
+            lines.append("# HELP {0} {1}".format(name, help))
+            lines.append("# TYPE {0} {1}".format(name, kind))
+            lines.append("{0} {1}".format(name, value))
+
+        return "\n".join(lines) + "\n"
+
+
+def _merge(result, title, stats):
+    target = result.get(title)
+
+    if target is None:
+        result[title] = {
+            "counts": dict(stats["counts"]),
+            "buckets": list(stats["buckets"]),
+            "latency_sum": stats["latency_sum"],
+            "size_sum": stats["size_sum"],
+            "in_flight": stats["in_flight"]
+        }
+        return
+
+    for status, count in stats["counts"].items():
+        target["counts"][status] = target["counts"].get(status, 0) + count
+
+    target["buckets"] = [a + b for a, b in zip(target["buckets"], stats["buckets"])]
+    target["latency_sum"] += stats["latency_sum"]
+    target["size_sum"] += stats["size_sum"]
+    target["in_flight"] += stats["in_flight"]
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
@@ -3,8 +3,11 @@
 from flask_restify.util.error import HttpError
 
 
-def _param_validation(name, t, v: any) -> any:
+def _param_validation(name, t, v: any, validate=None) -> any:
     try:
+        if validate is not None:
+            return validate(v)  # 미리 컴파일된 검증 함수 사용
+
         return t.validation(v)  # 파싱해서 집어넣음
     except BaseException as e:
         t_name = t.__module__ + "." + t.__class__.__qualname__
@@ -47,3 +50,52 @@ def parse_params(blueprint: dict, params: dict, defaults: dict={}) -> dict:
             raise HttpError(400, "파라미터 누락 '{0}'".format(k))
 
     return result
+
+
+_missing = object()
+
+
+def build_binding(places: list, arguments) -> list:
+    # 등록시점에 각 파라미터의 위치, 검증 함수, 시그니처 포함 여부를 미리 계산
+    plan = []
+
+    for place, blueprint in places:
+        if not blueprint:
+            continue
+
+        for k, v in blueprint.items():
+            plan.append((k, place, v, v.compile(), k in arguments))
+
+    return plan
+
+
+def bind_params(plan: list, sources: dict, defaults: dict) -> dict:
+    result = {**defaults}
+
+    for k, place, v, f, in_signature in plan:
+        # 시스템 Parameter에 이미 내용이 존재함
+        if k in defaults:
+            value = defaults[k]
+
+        else:
+            value = sources[place].get(k, _missing)
+
+            if value is _missing:
+                # 핸들러 인자로 선언되어 있으면 None으로 검증
+                if in_signature:
+                    value = None
+
+                # 옵셔널이면서 없음
+                elif v.optional:
+                    x = _param_validation(k, v, None, f)
+                    if x is not None:
+                        result[k] = x
+
+                    continue
+
+                else:
+                    raise HttpError(400, "파라미터 누락 '{0}'".format(k))
+
+        result[k] = _param_validation(k, v, value, f)
+
+    return result
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+from collections import deque
+import cProfile
+import hmac
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import uuid
+
+
+class Sampler(threading.Thread):
+    # 대상 thread의 stack을 주기적으로 수집하여 flamegraph용 collapsed stack 생성
+
+    def __init__(self, thread_id, interval=0.001):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = {}
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append("{0}.{1}".format(frame.f_globals.get("__name__", "?"), getattr(code, "co_qualname", code.co_name)))
+                frame = frame.f_back
+
+            key = ";".join(reversed(stack))
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def collapsed(self):
+        return "\n".join("{0} {1}".format(k, v) for k, v in sorted(self.counts.items()))
+
+
+class Profiler:
+    # 요청 단위 profiling
+    # - 요청 헤더(X-Profile) 또는 query(__profile)에 token을 넣으면 해당 요청을 profiling
+    # - sample_rate 비율만큼 endpoint별로 자동 수집하여 ring buffer에 보관
+    # - 초당 rate 개수를 넘는 profiling 요청은 무시
+
+    header = "X-Profile"
+    query = "__profile"
+
+    def __init__(self, token, sample_rate=0.0, rate=1.0, buffer=10, top=30, interval=0.001):
+        self.token = token
+        self.sample_rate = sample_rate
+        self.rate = rate
+        self.buffer = buffer
+        self.top = top
+        self.interval = interval
+
+        self._reports = {}  # endpoint -> deque
+        self._index = {}  # id -> report
+        self._lock = threading.Lock()
+
+        # cProfile은 동시에 하나만 활성화할 수 있으므로 (Python 3.12+) profiling 중인 요청이 있으면 profiling 없이 처리
+        self._active = threading.Lock()
+
+        self._allowance = rate
+        self._checked = time.monotonic()
+
+    def authorized(self, request):
+        value = request.headers.get(self.header) or request.args.get(self.query)
+
+        return bool(value) and hmac.compare_digest(value, self.token)
+
+    def wanted(self, request):
+        if self.authorized(request):
+            return self._acquire()
+
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return self._acquire()
+
+        return False
+
+    def _acquire(self):
+        # token bucket 기반 rate limit
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._checked) * self.rate)
+            self._checked = now
+
+            if self._allowance < 1:
+                return False
+
+            self._allowance -= 1
+            return True
+
+    def run(self, endpoint, f, *args, **kwargs):
+        if not self._active.acquire(blocking=False):
+            return f(*args, **kwargs)
+
+        state = {}
+
+        try:
+            self._begin(state)
+            return f(*args, **kwargs)
+        finally:
+            self._end(endpoint, state, args)
+
+    async def run_async(self, endpoint, f, *args, **kwargs):
+        # 이벤트 루프 thread를 profiling하므로 await 중에 실행된 다른 요청의 코드도 함께 집계될 수 있음
+        if not self._active.acquire(blocking=False):
+            return await f(*args, **kwargs)
+
+        state = {}
+
+        try:
+            self._begin(state)
+            return await f(*args, **kwargs)
+        finally:
+            self._end(endpoint, state, args)
+
+    def _begin(self, state):
+        state["start"] = time.perf_counter()
+        state["profile"] = cProfile.Profile()
+        state["sampler"] = Sampler(threading.get_ident(), self.interval)
+
+        state["sampler"].start()
+        state["profile"].enable()
+        state["enabled"] = True
+
+    def _end(self, endpoint, state, args):
+        profile = state.get("profile")
+        sampler = state.get("sampler")
+        enabled = state.get("enabled", False)
+
+        if enabled:
+            profile.disable()
+
+        if sampler is not None and sampler.is_alive():
+            sampler.stop()
+
+        self._active.release()
+
+        if enabled:
+            duration = time.perf_counter() - state["start"]
+            report_id = self.record(endpoint, duration, profile, sampler)
+
+            # 응답 헤더로 report id 전달
+            context = args[0] if len(args) > 0 else None
+            if context is not None and hasattr(context, "headers"):
+                context.headers["X-Profile-Id"] = report_id
+
+    def record(self, endpoint, duration, profile, sampler):
+        profile.create_stats()
+        stats = pstats.Stats(profile)
+
+        top = []
+        for (filename, line, name), (cc, nc, tt, ct, callers) in stats.stats.items():
+            top.append({
+                "function": "{0}:{1}({2})".format(os.path.basename(filename), line, name),
+                "calls": nc,
+                "tottime": round(tt * 1000, 3),
+                "cumtime": round(ct * 1000, 3)
+            })
+
+        top.sort(key=lambda x: x["cumtime"], reverse=True)
+
+        report = {
+            "id": uuid.uuid4().hex,
+            "endpoint": endpoint,
+            "time": time.time(),
+            "duration": round(duration * 1000, 3),
+            "top": top[:self.top],
+            "collapsed": sampler.collapsed(),
+            "pstats": marshal.dumps(stats.stats)
+        }
+
+        with self._lock:
+            if endpoint not in self._reports:
+                self._reports[endpoint] = deque(maxlen=self.buffer)
+
+            reports = self._reports[endpoint]
+            if len(reports) == reports.maxlen:
+                self._index.pop(reports[0]["id"], None)
+
+            reports.append(report)
+            self._index[report["id"]] = report
+
+        return report["id"]
+
+    def get(self, report_id):
+        return self._index.get(report_id)
+
+    def summary(self):
+        with self._lock:
+            return {
+                endpoint: [{k: r[k] for k in ["id", "time", "duration"]} for r in reports]
+                for endpoint, reports in self._reports.items()
+            }
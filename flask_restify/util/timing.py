@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+
+class ServerTiming:
+    # 요청 처리 단계별 소요시간 기록 (Server-Timing 헤더로 출력)
+
+    def __init__(self):
+        self.phases = {}
+        self.start = self.last = time.perf_counter()
+
+    def mark(self, name):
+        # 이전 mark 이후 경과시간을 name 단계에 누적
+        now = time.perf_counter()
+        self.phases[name] = self.phases.get(name, 0.0) + (now - self.last)
+        self.last = now
+
+    def total(self):
+        return self.last - self.start
+
+    def to_dict(self):
+        result = {name: round(d * 1000, 3) for name, d in self.phases.items()}
+        result["total"] = round(self.total() * 1000, 3)
+
+        return result
+
+    def header(self):
+        return ", ".join("{0};dur={1}".format(name, d) for name, d in self.to_dict().items())